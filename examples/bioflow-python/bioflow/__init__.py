@@ -13,8 +13,8 @@ Modules:
     - stats: Sequence and read statistics
 """
 
-from .sequence import Sequence, SequenceType, SequenceError
-from .kmer import KMerCounter, KMer
+from .sequence import Sequence, SequenceBatch, SequenceType, SequenceError
+from .kmer import KMerCounter, KMer, KMerBitset
 from .alignment import smith_waterman, needleman_wunsch, ScoringMatrix
 from .quality import QualityScores, QualityCategory, QualityError
 from .stats import SequenceStats, SequenceSetStats, ReadSetStats
@@ -22,10 +22,12 @@ from .stats import SequenceStats, SequenceSetStats, ReadSetStats
 __version__ = "0.1.0"
 __all__ = [
     "Sequence",
+    "SequenceBatch",
     "SequenceType",
     "SequenceError",
     "KMerCounter",
     "KMer",
+    "KMerBitset",
     "smith_waterman",
     "needleman_wunsch",
     "ScoringMatrix",
@@ -0,0 +1,133 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+BioFlow - Optional Cython Alignment Kernels
+
+Statically compiled DP fills for users without Numba. Built by setup.py
+when Cython is installed at install time; alignment.py falls back to the
+pure-Python fill when this module is missing.
+
+The fills mirror the Numba kernels in _numba_kernels.py: a single score
+row updated in place and one byte of traceback per cell, with codes
+following AlignDirection (0 stop, 1 diagonal, 2 up, 3 left). Bases are
+ASCII bytes and the substitution table is the flattened 128x128 table
+from ScoringMatrix.table().
+"""
+
+from libc.stdlib cimport malloc, free
+
+
+cdef list _split_rows(bytearray trace, Py_ssize_t rows, Py_ssize_t width):
+    """Cut the flat traceback into the per-row bytearrays the traceback walks."""
+    return [trace[i * width:(i + 1) * width] for i in range(rows)]
+
+
+def sw_fill(const unsigned char[::1] s1, const unsigned char[::1] s2,
+            const int[::1] table, int gap):
+    """
+    Smith-Waterman score and traceback fill.
+
+    Returns:
+        Tuple of (traceback rows, max_score, max_i, max_j)
+    """
+    cdef Py_ssize_t m = s1.shape[0]
+    cdef Py_ssize_t n = s2.shape[0]
+    cdef Py_ssize_t width = n + 1
+    cdef Py_ssize_t i, j
+    cdef int diag, left, above, best, score, max_score = 0
+    cdef Py_ssize_t max_i = 0, max_j = 0
+    cdef unsigned char direction
+    cdef const int *sub
+
+    trace = bytearray((m + 1) * width)
+    cdef unsigned char[::1] tb = trace
+    cdef int *row = <int *> malloc(width * sizeof(int))
+    if row == NULL:
+        raise MemoryError()
+
+    with nogil:
+        for j in range(width):
+            row[j] = 0
+        for i in range(1, m + 1):
+            sub = &table[s1[i - 1] * 128]
+            diag = 0       # H[i - 1][j - 1]
+            left = 0       # H[i][j - 1]
+            for j in range(1, n + 1):
+                above = row[j]
+                best = 0
+                direction = 0
+                score = diag + sub[s2[j - 1]]
+                if score > best:
+                    best = score
+                    direction = 1
+                if above + gap > best:
+                    best = above + gap
+                    direction = 2
+                if left + gap > best:
+                    best = left + gap
+                    direction = 3
+
+                row[j] = best
+                tb[i * width + j] = direction
+                diag = above
+                left = best
+                if best > max_score:
+                    max_score = best
+                    max_i = i
+                    max_j = j
+    free(row)
+
+    return _split_rows(trace, m + 1, width), max_score, max_i, max_j
+
+
+def nw_fill(const unsigned char[::1] s1, const unsigned char[::1] s2,
+            const int[::1] table, int gap):
+    """
+    Needleman-Wunsch score and traceback fill.
+
+    Returns:
+        Tuple of (traceback rows, final score)
+    """
+    cdef Py_ssize_t m = s1.shape[0]
+    cdef Py_ssize_t n = s2.shape[0]
+    cdef Py_ssize_t width = n + 1
+    cdef Py_ssize_t i, j
+    cdef int diag, left, above, best, score
+    cdef unsigned char direction
+    cdef const int *sub
+
+    trace = bytearray((m + 1) * width)
+    cdef unsigned char[::1] tb = trace
+    cdef int *row = <int *> malloc(width * sizeof(int))
+    if row == NULL:
+        raise MemoryError()
+
+    with nogil:
+        for j in range(width):
+            row[j] = <int> j * gap
+            if j > 0:
+                tb[j] = 3
+        for i in range(1, m + 1):
+            sub = &table[s1[i - 1] * 128]
+            diag = row[0]
+            left = <int> i * gap
+            row[0] = left
+            tb[i * width] = 2
+            for j in range(1, n + 1):
+                above = row[j]
+                best = diag + sub[s2[j - 1]]
+                direction = 1
+                if above + gap > best:
+                    best = above + gap
+                    direction = 2
+                if left + gap > best:
+                    best = left + gap
+                    direction = 3
+
+                row[j] = best
+                tb[i * width + j] = direction
+                diag = above
+                left = best
+        score = row[n]
+    free(row)
+
+    return _split_rows(trace, m + 1, width), score
@@ -0,0 +1,224 @@
+"""
+BioFlow - Numba JIT Kernels
+
+The njit loops behind _numba_kernels. Importing this module imports
+Numba, so it is only loaded on first use through _numba_kernels; nothing
+else should import it directly.
+"""
+
+import numpy as np
+from numba import njit
+
+__all__ = ['count_bases_u8', 'reverse_complement_u8', 'sw_fill', 'nw_fill', 'sw_score']
+
+
+# SWAR constants: a byte repeated across a 64-bit word
+_BYTE_ONES = np.uint64(0x0101010101010101)
+_LOW7 = np.uint64(0x7F7F7F7F7F7F7F7F)
+
+
+@njit(cache=True)
+def _count_byte(word, pattern):
+    """
+    Count the bytes of word equal to the byte repeated in pattern.
+
+    Matching bytes XOR to zero; the carry-free zero-byte test leaves
+    exactly their high bits set, and the multiply sums those bits
+    into the top byte.
+    """
+    x = word ^ pattern
+    zero = ~(((x & _LOW7) + _LOW7) | x | _LOW7)
+    return ((zero >> np.uint64(7)) * _BYTE_ONES) >> np.uint64(56)
+
+
+@njit(cache=True)
+def count_bases_u8(arr):
+    """
+    Count A, C, G, T/U and N in a single pass.
+
+    The bulk is read eight bases per uint64 word and each base is
+    counted with a SWAR byte compare; the tail is counted byte by byte.
+
+    Returns:
+        Tuple of (A_count, C_count, G_count, T_count, N_count)
+    """
+    n = arr.shape[0]
+    bulk = n - n % 8
+    words = arr[:bulk].view(np.uint64)
+    pa = _BYTE_ONES * np.uint64(65)
+    pc = _BYTE_ONES * np.uint64(67)
+    pg = _BYTE_ONES * np.uint64(71)
+    pt = _BYTE_ONES * np.uint64(84)
+    pu = _BYTE_ONES * np.uint64(85)
+    pn = _BYTE_ONES * np.uint64(78)
+
+    a = c = g = t = nn = 0
+    for i in range(words.shape[0]):
+        w = words[i]
+        a += _count_byte(w, pa)
+        c += _count_byte(w, pc)
+        g += _count_byte(w, pg)
+        t += _count_byte(w, pt) + _count_byte(w, pu)
+        nn += _count_byte(w, pn)
+
+    for i in range(bulk, n):
+        x = arr[i]
+        if x == 65:        # A
+            a += 1
+        elif x == 67:      # C
+            c += 1
+        elif x == 71:      # G
+            g += 1
+        elif x == 84 or x == 85:  # T or U
+            t += 1
+        elif x == 78:      # N
+            nn += 1
+    return a, c, g, t, nn
+
+
+# Byte-wise complement table (A<->T, C<->G, N->N)
+_COMPLEMENT_LUT = np.frombuffer(bytes.maketrans(b'ACGTN', b'TGCAN'), dtype=np.uint8).copy()
+
+
+@njit(cache=True)
+def _reverse_complement_lut(arr, lut):
+    n = arr.shape[0]
+    out = np.empty(n, dtype=np.uint8)
+    for i in range(n):
+        out[n - 1 - i] = lut[arr[i]]
+    return out
+
+
+def reverse_complement_u8(arr):
+    """
+    Complement and reverse in one pass into a single new buffer.
+
+    The table is passed in as an argument: read as a frozen global
+    constant, the same loop measured about 2x slower.
+    """
+    return _reverse_complement_lut(arr, _COMPLEMENT_LUT)
+
+
+@njit(cache=True)
+def sw_fill(s1, s2, table, gap):
+    """
+    Smith-Waterman score and traceback fill over uint8 base buffers.
+
+    Only the int8 traceback is kept as a full matrix; scores live in a
+    single row updated in place, so the fill streams one byte per cell.
+    Traceback codes follow AlignDirection: 0 stop, 1 diagonal,
+    2 up, 3 left.
+
+    Returns:
+        Tuple of (traceback matrix, max_score, max_i, max_j)
+    """
+    m = s1.shape[0]
+    n = s2.shape[0]
+    trace = np.zeros((m + 1, n + 1), dtype=np.int8)
+    row = np.zeros(n + 1, dtype=np.int32)
+    max_score = 0
+    max_i = 0
+    max_j = 0
+
+    for i in range(1, m + 1):
+        sub = table[s1[i - 1]]
+        diag = 0       # H[i - 1][j - 1]
+        left = 0       # H[i][j - 1]
+        for j in range(1, n + 1):
+            above = row[j]
+            best = 0
+            direction = 0
+            score = diag + sub[s2[j - 1]]
+            if score > best:
+                best = score
+                direction = 1
+            if above + gap > best:
+                best = above + gap
+                direction = 2
+            if left + gap > best:
+                best = left + gap
+                direction = 3
+
+            row[j] = best
+            trace[i, j] = direction
+            diag = above
+            left = best
+            if best > max_score:
+                max_score = best
+                max_i = i
+                max_j = j
+
+    return trace, max_score, max_i, max_j
+
+
+@njit(cache=True)
+def nw_fill(s1, s2, table, gap):
+    """
+    Needleman-Wunsch score and traceback fill over uint8 base buffers.
+
+    Uses the same single score row as sw_fill.
+
+    Returns:
+        Tuple of (traceback matrix, final score)
+    """
+    m = s1.shape[0]
+    n = s2.shape[0]
+    trace = np.empty((m + 1, n + 1), dtype=np.int8)
+    row = np.empty(n + 1, dtype=np.int32)
+    trace[0, 0] = 0
+    for j in range(n + 1):
+        row[j] = j * gap
+        if j > 0:
+            trace[0, j] = 3
+
+    for i in range(1, m + 1):
+        sub = table[s1[i - 1]]
+        diag = row[0]
+        left = i * gap
+        row[0] = left
+        trace[i, 0] = 2
+        for j in range(1, n + 1):
+            above = row[j]
+            best = diag + sub[s2[j - 1]]
+            direction = 1
+            if above + gap > best:
+                best = above + gap
+                direction = 2
+            if left + gap > best:
+                best = left + gap
+                direction = 3
+
+            row[j] = best
+            trace[i, j] = direction
+            diag = above
+            left = best
+
+    return trace, row[n]
+
+
+@njit(cache=True)
+def sw_score(s1, s2, table, gap):
+    """Best Smith-Waterman score using two rolling rows."""
+    n = s2.shape[0]
+    prev = np.zeros(n + 1, dtype=np.int32)
+    curr = np.zeros(n + 1, dtype=np.int32)
+    max_score = 0
+
+    for i in range(s1.shape[0]):
+        sub = table[s1[i]]
+        for j in range(1, n + 1):
+            best = prev[j - 1] + sub[s2[j - 1]]
+            up = prev[j] + gap
+            left = curr[j - 1] + gap
+            if up > best:
+                best = up
+            if left > best:
+                best = left
+            if best < 0:
+                best = 0
+            curr[j] = best
+            if best > max_score:
+                max_score = best
+        prev, curr = curr, prev
+
+    return max_score
@@ -0,0 +1,49 @@
+"""
+BioFlow - Optional Numba Kernels
+
+JIT-compiled loops over uint8 base buffers, used for very long sequences
+when Numba is installed (pip install bioflow[numba]).
+
+Every kernel has a pure-Python equivalent in the calling module, so
+NUMBA_AVAILABLE must be checked before calling anything here. Importing
+Numba costs a few hundred milliseconds, so neither it nor the kernels
+(in _numba_jit) are loaded until NUMBA_AVAILABLE or a kernel is first
+looked up. Callers check their size threshold before NUMBA_AVAILABLE, so
+short inputs never pay for the import.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; without it Numba is unavailable too
+    np = None
+
+
+def __getattr__(name):
+    """Import Numba and the kernels on first lookup (PEP 562)."""
+    global NUMBA_AVAILABLE
+    if name.startswith('__') or 'NUMBA_AVAILABLE' in globals():
+        # Dunder probes (pickle, inspect, ...) or a real miss after loading
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        from . import _numba_jit
+    except ImportError:  # Numba (or NumPy) is not installed
+        NUMBA_AVAILABLE = False
+    else:
+        NUMBA_AVAILABLE = True
+        for kernel in _numba_jit.__all__:
+            globals()[kernel] = getattr(_numba_jit, kernel)
+    if name in globals():
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def as_u8(text):
+    """View ASCII bytes (or an ASCII string, encoded first) as a uint8 array."""
+    if isinstance(text, str):
+        text = text.encode('ascii')
+    return np.frombuffer(text, dtype=np.uint8)
+
+
+def as_table(rows):
+    """Convert a nested substitution table to a contiguous int32 array."""
+    return np.ascontiguousarray(rows, dtype=np.int32)
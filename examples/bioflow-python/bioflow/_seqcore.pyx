@@ -0,0 +1,47 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+BioFlow - Optional Cython Sequence Primitives
+
+Compiled byte loops for Sequence, for users without Numba. Built by
+setup.py when Cython is installed at install time; sequence.py falls back
+to the NumPy / str paths when this module is missing.
+
+Validation and complement are not here: bytes.translate and
+str.translate already run them as single C passes.
+"""
+
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_FromStringAndSize
+
+
+def count_bases(const unsigned char[::1] buf):
+    """
+    Count A, C, G, T/U and N in a single pass over ASCII bytes.
+
+    Returns:
+        Tuple of (A_count, C_count, G_count, T_count, N_count)
+    """
+    cdef Py_ssize_t hist[256]
+    cdef Py_ssize_t i, n = buf.shape[0]
+    for i in range(256):
+        hist[i] = 0
+    with nogil:
+        for i in range(n):
+            hist[buf[i]] += 1
+    return hist[65], hist[67], hist[71], hist[84] + hist[85], hist[78]
+
+
+def reverse_complement(const unsigned char[::1] buf):
+    """Complement (A<->T, C<->G, N->N) and reverse in one pass into new bytes."""
+    cdef unsigned char table[256]
+    cdef Py_ssize_t i, n = buf.shape[0]
+    for i in range(256):
+        table[i] = <unsigned char> i
+    table[65], table[84] = 84, 65
+    table[67], table[71] = 71, 67
+
+    out = PyBytes_FromStringAndSize(NULL, n)
+    cdef unsigned char *dst = <unsigned char *> PyBytes_AS_STRING(out)
+    with nogil:
+        for i in range(n):
+            dst[n - 1 - i] = table[buf[i]]
+    return out
@@ -19,21 +19,62 @@ Python relies on assertions and runtime checks:
         assert len(aligned1) == len(aligned2)  # Runtime only
 """
 
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from typing import Tuple, List, Optional
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntEnum
+from functools import lru_cache
 
-from .sequence import Sequence
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional (pip install bioflow[numpy])
+    np = None
 
+try:
+    import parasail
+except ImportError:  # parasail is optional (pip install bioflow[parasail])
+    parasail = None
 
-class AlignDirection(Enum):
-    """Alignment direction for traceback."""
+from .sequence import Sequence, SequenceType
+from . import _numba_kernels as _kernels
+
+try:
+    from . import _align as _cython
+except ImportError:  # compiled only when Cython is present at install time
+    _cython = None
+
+
+# Below this many DP cells, worker start-up costs more than it saves
+_PARALLEL_MIN_CELLS = 1 << 24
+
+# Below this many DP cells the Python fill beats the warm Numba kernels
+# (traceback setup dominates), and importing Numba is not worth it either
+_NUMBA_MIN_CELLS = 1 << 13
+
+
+class AlignDirection(IntEnum):
+    """
+    Alignment direction for traceback.
+
+    An IntEnum so traceback rows can store the codes as bytes (bytearray
+    rows in Python, int8 matrices from the Numba kernels) and still be
+    walked by the same traceback code.
+    """
     DIAGONAL = 1  # Match or mismatch
     UP = 2        # Gap in sequence 2
     LEFT = 3      # Gap in sequence 1
     STOP = 0      # End of alignment (local only)
 
 
+# Plain-int direction codes for the DP inner loops
+_STOP, _DIAGONAL, _UP, _LEFT = (
+    int(AlignDirection.STOP), int(AlignDirection.DIAGONAL),
+    int(AlignDirection.UP), int(AlignDirection.LEFT)
+)
+
+
 class AlignmentType(Enum):
     """Type of alignment."""
     GLOBAL = "global"       # Needleman-Wunsch style
@@ -41,11 +82,13 @@ class AlignmentType(Enum):
     SEMI_GLOBAL = "semi"    # Hybrid approach
 
 
-@dataclass
+@dataclass(frozen=True)
 class ScoringMatrix:
     """
     Scoring matrix for nucleotide alignment.
 
+    Frozen, so the factory presets can be shared between callers.
+
     Aria equivalent:
         struct ScoringMatrix
           match_score: Int
@@ -75,8 +118,9 @@ class ScoringMatrix:
 
     @classmethod
     def default_dna(cls) -> 'ScoringMatrix':
-        """Create default DNA scoring matrix."""
-        return cls(
+        """Return the default DNA scoring matrix (a shared instance)."""
+        return _shared_matrix(
+            cls,
             match_score=2,
             mismatch_penalty=-1,
             gap_open_penalty=-2,
@@ -85,8 +129,9 @@ class ScoringMatrix:
 
     @classmethod
     def blast_like(cls) -> 'ScoringMatrix':
-        """Create BLAST-like scoring matrix."""
-        return cls(
+        """Return the BLAST-like scoring matrix (a shared instance)."""
+        return _shared_matrix(
+            cls,
             match_score=1,
             mismatch_penalty=-3,
             gap_open_penalty=-5,
@@ -113,6 +158,30 @@ class ScoringMatrix:
         """Return gap penalty (linear model)."""
         return self.gap_open_penalty
 
+    def table(self) -> Tuple[Tuple[int, ...], ...]:
+        """
+        Return a 128x128 substitution table indexed by ASCII codes.
+
+        table()[ord(a)][ord(b)] == score(a, b) for any two ASCII bases,
+        so DP loops can look scores up instead of branching per cell.
+        """
+        return _score_table(self.match_score, self.mismatch_penalty)
+
+
+@lru_cache(maxsize=None)
+def _shared_matrix(cls, **params) -> ScoringMatrix:
+    """Build each preset scoring matrix once per class."""
+    return cls(**params)
+
+
+@lru_cache(maxsize=None)
+def _score_table(match: int, mismatch: int) -> Tuple[Tuple[int, ...], ...]:
+    """Build (and cache) the ASCII substitution table for ScoringMatrix.table."""
+    return tuple(
+        tuple(match if a == b else mismatch for b in range(128))
+        for a in range(128)
+    )
+
 
 @dataclass
 class Alignment:
@@ -261,7 +330,10 @@ class Alignment:
         if len(self.aligned_seq1) == 0:
             return ""
 
-        cigar = ""
+        if np is not None:
+            return self._to_cigar_numpy()
+
+        parts = []
         current_op = ""
         count = 0
 
@@ -279,14 +351,30 @@ class Alignment:
                 count += 1
             else:
                 if count > 0:
-                    cigar += f"{count}{current_op}"
+                    parts.append(f"{count}{current_op}")
                 current_op = op
                 count = 1
 
-        if count > 0:
-            cigar += f"{count}{current_op}"
-
-        return cigar
+        parts.append(f"{count}{current_op}")
+        return ''.join(parts)
+
+    def _to_cigar_numpy(self) -> str:
+        """CIGAR via run boundaries found with np.diff over op codes."""
+        a = np.frombuffer(self.aligned_seq1.encode('ascii'), dtype=np.uint8)
+        b = np.frombuffer(self.aligned_seq2.encode('ascii'), dtype=np.uint8)
+        gap = ord('-')
+
+        # Insertion, deletion, match, mismatch
+        ops = np.where(a == gap, ord('I'),
+                       np.where(b == gap, ord('D'),
+                                np.where(a == b, ord('M'), ord('X')))).astype(np.uint8)
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(ops)) + 1))
+        lengths = np.diff(np.append(starts, len(ops)))
+
+        return ''.join(
+            f"{length}{op}"
+            for length, op in zip(lengths.tolist(), ops[starts].tobytes().decode('ascii'))
+        )
 
     def format(self) -> str:
         """Format alignment for display."""
@@ -345,53 +433,68 @@ def smith_waterman(
     if len(seq1) == 0 or len(seq2) == 0:
         raise ValueError("Sequences must be non-empty")
 
+    if len(seq1) * len(seq2) >= _NUMBA_MIN_CELLS and _kernels.NUMBA_AVAILABLE:
+        return _smith_waterman_numba(seq1.bases, seq2.bases, scoring)
+    if _cython is not None:
+        return _smith_waterman_cython(seq1.bases, seq2.bases, scoring)
+
     m, n = len(seq1), len(seq2)
     s1, s2 = seq1.bases, seq2.bases
 
-    # Initialize scoring matrix with zeros
-    H = [[0] * (n + 1) for _ in range(m + 1)]
-
-    # Initialize traceback matrix
-    traceback = [[AlignDirection.STOP] * (n + 1) for _ in range(m + 1)]
+    # Only the previous score row is needed; the traceback keeps one
+    # bytearray of direction codes per row (1 byte per cell)
+    prev = [0] * (n + 1)
+    traceback = [bytearray(n + 1)]
 
     # Track maximum score and position
     max_score = 0
     max_i, max_j = 0, 0
 
+    table = scoring.table()
+    codes2 = s2.encode('ascii')
+    gap = scoring.gap_penalty()
+
     # Fill matrices
     for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            match_score = scoring.score(s1[i - 1], s2[j - 1])
+        sub = table[ord(s1[i - 1])]
+        curr = [0] * (n + 1)
+        trace = bytearray(n + 1)
+        diag = 0  # H[i - 1][j - 1]
+        left = 0  # H[i][j - 1]
 
-            # Calculate scores for each direction
-            diag = H[i - 1][j - 1] + match_score
-            up = H[i - 1][j] + scoring.gap_penalty()
-            left = H[i][j - 1] + scoring.gap_penalty()
+        for j in range(1, n + 1):
+            above = prev[j]
 
             # Find maximum (including 0 for local alignment)
             best = 0
-            direction = AlignDirection.STOP
+            direction = _STOP
 
-            if diag > best:
-                best = diag
-                direction = AlignDirection.DIAGONAL
+            score = diag + sub[codes2[j - 1]]
+            if score > best:
+                best = score
+                direction = _DIAGONAL
 
-            if up > best:
-                best = up
-                direction = AlignDirection.UP
+            if above + gap > best:
+                best = above + gap
+                direction = _UP
 
-            if left > best:
-                best = left
-                direction = AlignDirection.LEFT
+            if left + gap > best:
+                best = left + gap
+                direction = _LEFT
 
-            H[i][j] = best
-            traceback[i][j] = direction
+            curr[j] = best
+            trace[j] = direction
+            diag = above
+            left = best
 
             # Update maximum
             if best > max_score:
                 max_score = best
                 max_i, max_j = i, j
 
+        traceback.append(trace)
+        prev = curr
+
     # Traceback
     aligned1, aligned2, start1, start2 = _traceback_local(
         s1, s2, traceback, max_i, max_j
@@ -407,7 +510,7 @@ def smith_waterman(
 def _traceback_local(
     seq1: str,
     seq2: str,
-    traceback: List[List[AlignDirection]],
+    traceback: List[bytearray],
     start_i: int,
     start_j: int
 ) -> Tuple[str, str, int, int]:
@@ -468,59 +571,66 @@ def needleman_wunsch(
     if len(seq1) == 0 or len(seq2) == 0:
         raise ValueError("Sequences must be non-empty")
 
+    if len(seq1) * len(seq2) >= _NUMBA_MIN_CELLS and _kernels.NUMBA_AVAILABLE:
+        return _needleman_wunsch_numba(seq1.bases, seq2.bases, scoring)
+    if _cython is not None:
+        return _needleman_wunsch_cython(seq1.bases, seq2.bases, scoring)
+
     m, n = len(seq1), len(seq2)
     s1, s2 = seq1.bases, seq2.bases
 
-    # Initialize scoring matrix with gap penalties
-    H = [[0] * (n + 1) for _ in range(m + 1)]
+    table = scoring.table()
+    codes2 = s2.encode('ascii')
+    gap = scoring.gap_penalty()
 
-    # First row and column initialized with gap penalties
-    for i in range(m + 1):
-        H[i][0] = i * scoring.gap_penalty()
-    for j in range(n + 1):
-        H[0][j] = j * scoring.gap_penalty()
-
-    # Initialize traceback matrix
-    traceback = [[AlignDirection.STOP] * (n + 1) for _ in range(m + 1)]
-    for i in range(1, m + 1):
-        traceback[i][0] = AlignDirection.UP
-    for j in range(1, n + 1):
-        traceback[0][j] = AlignDirection.LEFT
+    # First row initialized with gap penalties; traceback rows are
+    # bytearrays of direction codes as in smith_waterman
+    prev = [j * gap for j in range(n + 1)]
+    traceback = [bytearray([_STOP] + [_LEFT] * n)]
 
     # Fill matrices
     for i in range(1, m + 1):
-        for j in range(1, n + 1):
-            match_score = scoring.score(s1[i - 1], s2[j - 1])
+        sub = table[ord(s1[i - 1])]
+        curr = [0] * (n + 1)
+        curr[0] = i * gap
+        trace = bytearray(n + 1)
+        trace[0] = _UP
+        diag = prev[0]
+        left = curr[0]
 
-            diag = H[i - 1][j - 1] + match_score
-            up = H[i - 1][j] + scoring.gap_penalty()
-            left = H[i][j - 1] + scoring.gap_penalty()
+        for j in range(1, n + 1):
+            above = prev[j]
 
             # Find maximum (no zero threshold for global)
-            best = diag
-            direction = AlignDirection.DIAGONAL
+            best = diag + sub[codes2[j - 1]]
+            direction = _DIAGONAL
 
-            if up > best:
-                best = up
-                direction = AlignDirection.UP
+            if above + gap > best:
+                best = above + gap
+                direction = _UP
 
-            if left > best:
-                best = left
-                direction = AlignDirection.LEFT
+            if left + gap > best:
+                best = left + gap
+                direction = _LEFT
 
-            H[i][j] = best
-            traceback[i][j] = direction
+            curr[j] = best
+            trace[j] = direction
+            diag = above
+            left = best
+
+        traceback.append(trace)
+        prev = curr
 
     # Traceback from bottom-right corner
     aligned1, aligned2 = _traceback_global(s1, s2, traceback, m, n)
 
-    return Alignment.new(aligned1, aligned2, H[m][n], AlignmentType.GLOBAL)
+    return Alignment.new(aligned1, aligned2, prev[n], AlignmentType.GLOBAL)
 
 
 def _traceback_global(
     seq1: str,
     seq2: str,
-    traceback: List[List[AlignDirection]],
+    traceback: List[bytearray],
     m: int,
     n: int
 ) -> Tuple[str, str]:
@@ -560,6 +670,124 @@ def _traceback_global(
     return aligned1, aligned2
 
 
+@lru_cache(maxsize=None)
+def _parasail_matrix(match: int, mismatch: int):
+    """Return a parasail substitution matrix over the nucleotide alphabet."""
+    return parasail.matrix_create("ACGTUN", match, mismatch)
+
+
+# Largest score a signed 16-bit parasail lane holds before saturating
+_INT16_MAX = (1 << 15) - 1
+
+
+def _fits_16bit(len1: int, len2: int, scoring: ScoringMatrix) -> bool:
+    """
+    Whether every local-alignment DP cell is guaranteed to fit a 16-bit lane.
+
+    Local scores never go below zero and are at most match * min(len1, len2).
+    """
+    return scoring.match_score * min(len1, len2) <= _INT16_MAX
+
+
+def _parasail_sw_score(s1: str, s2: str, scoring: ScoringMatrix) -> int:
+    """
+    Smith-Waterman score from parasail's kernels, with the linear gap model.
+
+    parasail only backs score-only calls: its tracebacks break ties
+    between equal-scoring alignments differently from the DP fills here,
+    so smith_waterman / needleman_wunsch never use it.
+
+    The prefix-scan kernels are used rather than the striped ones: with
+    open == extend (a linear gap) the striped kernels can return wrong
+    scores. The lane width is picked from a score bound, so inputs that
+    would overflow 16 bits go straight to the 32-bit kernel instead of
+    paying for a saturated pass first; the 16-bit result is still
+    checked and re-run at 32 bits if it saturates. 8-bit lanes are not
+    used: their scan kernels measure slower than 16-bit at sizes where
+    scores fit in 8 bits.
+    """
+    gap = -scoring.gap_penalty()
+    matrix = _parasail_matrix(scoring.match_score, scoring.mismatch_penalty)
+
+    if _fits_16bit(len(s1), len(s2), scoring):
+        result = parasail.sw_scan_16(s1, s2, gap, gap, matrix)
+        if not result.saturated:
+            return result.score
+    return parasail.sw_scan_32(s1, s2, gap, gap, matrix).score
+
+
+@lru_cache(maxsize=None)
+def _kernel_table(match: int, mismatch: int):
+    """Return the substitution table as the int32 array the Numba kernels take."""
+    return _kernels.as_table(_score_table(match, mismatch))
+
+
+def _smith_waterman_numba(s1: str, s2: str, scoring: ScoringMatrix) -> Alignment:
+    """Smith-Waterman with the DP fill JIT-compiled by Numba."""
+    traceback, max_score, max_i, max_j = _kernels.sw_fill(
+        _kernels.as_u8(s1), _kernels.as_u8(s2),
+        _kernel_table(scoring.match_score, scoring.mismatch_penalty),
+        scoring.gap_penalty()
+    )
+    aligned1, aligned2, start1, start2 = _traceback_local(
+        s1, s2, traceback, max_i, max_j
+    )
+
+    return Alignment.with_positions(
+        aligned1, aligned2, int(max_score),
+        start1, max_i, start2, max_j,
+        AlignmentType.LOCAL
+    )
+
+
+def _needleman_wunsch_numba(s1: str, s2: str, scoring: ScoringMatrix) -> Alignment:
+    """Needleman-Wunsch with the DP fill JIT-compiled by Numba."""
+    traceback, score = _kernels.nw_fill(
+        _kernels.as_u8(s1), _kernels.as_u8(s2),
+        _kernel_table(scoring.match_score, scoring.mismatch_penalty),
+        scoring.gap_penalty()
+    )
+    aligned1, aligned2 = _traceback_global(s1, s2, traceback, len(s1), len(s2))
+
+    return Alignment.new(aligned1, aligned2, int(score), AlignmentType.GLOBAL)
+
+
+@lru_cache(maxsize=None)
+def _flat_table(match: int, mismatch: int) -> array:
+    """Return the substitution table flattened to the int buffer _align takes."""
+    return array('i', [v for row in _score_table(match, mismatch) for v in row])
+
+
+def _smith_waterman_cython(s1: str, s2: str, scoring: ScoringMatrix) -> Alignment:
+    """Smith-Waterman with the DP fill from the compiled _align extension."""
+    traceback, max_score, max_i, max_j = _cython.sw_fill(
+        s1.encode('ascii'), s2.encode('ascii'),
+        _flat_table(scoring.match_score, scoring.mismatch_penalty),
+        scoring.gap_penalty()
+    )
+    aligned1, aligned2, start1, start2 = _traceback_local(
+        s1, s2, traceback, max_i, max_j
+    )
+
+    return Alignment.with_positions(
+        aligned1, aligned2, max_score,
+        start1, max_i, start2, max_j,
+        AlignmentType.LOCAL
+    )
+
+
+def _needleman_wunsch_cython(s1: str, s2: str, scoring: ScoringMatrix) -> Alignment:
+    """Needleman-Wunsch with the DP fill from the compiled _align extension."""
+    traceback, score = _cython.nw_fill(
+        s1.encode('ascii'), s2.encode('ascii'),
+        _flat_table(scoring.match_score, scoring.mismatch_penalty),
+        scoring.gap_penalty()
+    )
+    aligned1, aligned2 = _traceback_global(s1, s2, traceback, len(s1), len(s2))
+
+    return Alignment.new(aligned1, aligned2, score, AlignmentType.GLOBAL)
+
+
 def simple_align(seq1: Sequence, seq2: Sequence) -> Alignment:
     """
     Simple alignment using default settings.
@@ -593,25 +821,41 @@ def alignment_score_only(
     if len(seq1) == 0 or len(seq2) == 0:
         raise ValueError("Sequences must be non-empty")
 
-    m, n = len(seq1), len(seq2)
-    s1, s2 = seq1.bases, seq2.bases
+    if parasail is not None:
+        return _parasail_sw_score(seq1.bases, seq2.bases, scoring)
+    if len(seq1) * len(seq2) >= _NUMBA_MIN_CELLS and _kernels.NUMBA_AVAILABLE:
+        return int(_kernels.sw_score(
+            _kernels.as_u8(seq1.raw), _kernels.as_u8(seq2.raw),
+            _kernel_table(scoring.match_score, scoring.mismatch_penalty),
+            scoring.gap_penalty()
+        ))
+
+    return _sw_score_only(seq1.bases, seq2.bases, scoring)
+
+
+def _sw_score_only(s1: str, s2: str, scoring: ScoringMatrix) -> int:
+    """
+    Pure-Python two-row Smith-Waterman score.
+
+    The two rows are allocated once and swapped; column 0 is never
+    written, so the reused row needs no reset.
+    """
+    n = len(s2)
+    table = scoring.table()
+    codes2 = s2.encode('ascii')
+    gap = scoring.gap_penalty()
 
-    # Use two rows instead of full matrix
     prev_row = [0] * (n + 1)
     curr_row = [0] * (n + 1)
 
     max_score = 0
 
-    for i in range(1, m + 1):
-        # Reset current row
-        curr_row = [0] * (n + 1)
-
+    for a in s1:
+        sub = table[ord(a)]
         for j in range(1, n + 1):
-            match_score = scoring.score(s1[i - 1], s2[j - 1])
-
-            diag = prev_row[j - 1] + match_score
-            up = prev_row[j] + scoring.gap_penalty()
-            left = curr_row[j - 1] + scoring.gap_penalty()
+            diag = prev_row[j - 1] + sub[codes2[j - 1]]
+            up = prev_row[j] + gap
+            left = curr_row[j - 1] + gap
 
             best = max(0, diag, up, left)
             curr_row[j] = best
@@ -625,6 +869,72 @@ def alignment_score_only(
     return max_score
 
 
+def score_all_vs_all(
+    sequences: List[Sequence],
+    scoring: Optional[ScoringMatrix] = None
+) -> List[List[int]]:
+    """
+    Smith-Waterman scores for every pair of sequences.
+
+    With parasail, each query's substitution profile is built once and
+    reused for all of its targets. Scores are symmetric, so only the upper
+    triangle is aligned and mirrored.
+
+    Aria equivalent:
+        fn score_all_vs_all(sequences: [Sequence], scoring: ScoringMatrix) -> [[Int]]
+          requires sequences.len() > 0
+          ensures result.len() == sequences.len()
+    """
+    if scoring is None:
+        scoring = ScoringMatrix.default_dna()
+
+    if len(sequences) == 0:
+        raise ValueError("Sequence list cannot be empty")
+
+    count = len(sequences)
+    scores = [[0] * count for _ in range(count)]
+
+    for i, query in enumerate(sequences):
+        targets = sequences[i:]
+        if parasail is not None:
+            row = _profile_scores_parasail(query.bases, [t.bases for t in targets], scoring)
+        else:
+            row = [alignment_score_only(query, target, scoring) for target in targets]
+
+        for j, score in enumerate(row, i):
+            scores[i][j] = scores[j][i] = score
+
+    return scores
+
+
+def _profile_scores_parasail(query: str, targets: List[str], scoring: ScoringMatrix) -> List[int]:
+    """
+    Score one query against many targets with a reused parasail profile.
+
+    As in _parasail_sw_score, the scan kernels are used for the linear gap
+    model and the lane width is chosen per target from the score bound.
+    Each profile is only built once some target needs it.
+    """
+    gap = -scoring.gap_penalty()
+    matrix = _parasail_matrix(scoring.match_score, scoring.mismatch_penalty)
+    profile16 = None
+    profile32 = None
+
+    scores = []
+    for target in targets:
+        result = None
+        if _fits_16bit(len(query), len(target), scoring):
+            if profile16 is None:
+                profile16 = parasail.profile_create_16(query, matrix)
+            result = parasail.sw_scan_profile_16(profile16, target, gap, gap)
+        if result is None or result.saturated:
+            if profile32 is None:
+                profile32 = parasail.profile_create_32(query, matrix)
+            result = parasail.sw_scan_profile_32(profile32, target, gap, gap)
+        scores.append(max(result.score, 0))
+    return scores
+
+
 def percent_identity(aligned1: str, aligned2: str) -> float:
     """
     Calculate percent identity between two aligned sequences.
@@ -648,14 +958,34 @@ def percent_identity(aligned1: str, aligned2: str) -> float:
     return (matches / len(aligned1)) * 100.0
 
 
+def _align_one(args: Tuple[str, str, SequenceType, SequenceType, ScoringMatrix]) -> Alignment:
+    """
+    Align one query/target pair (module-level so worker processes can pickle it).
+
+    Tasks carry plain base strings rather than Sequence objects, so cached
+    bytes and code arrays are not pickled to the workers.
+    """
+    query_bases, target_bases, query_type, target_type, scoring = args
+    return smith_waterman(
+        Sequence._unchecked(query_bases, query_type),
+        Sequence._unchecked(target_bases, target_type),
+        scoring
+    )
+
+
 def align_against_multiple(
     query: Sequence,
     targets: List[Sequence],
-    scoring: Optional[ScoringMatrix] = None
+    scoring: Optional[ScoringMatrix] = None,
+    jobs: int = 0
 ) -> List[Tuple[int, Alignment]]:
     """
     Align a sequence against multiple targets.
 
+    Targets are spread over a process pool, since the pure-Python DP holds
+    the GIL. jobs=1 forces serial alignment; jobs=0 uses one worker per CPU,
+    but only when the batch is large enough to repay starting the pool.
+
     Aria equivalent:
         fn align_against_multiple(query: Sequence, targets: [Sequence], scoring: ScoringMatrix)
           -> [(Int, Alignment)]
@@ -668,19 +998,32 @@ def align_against_multiple(
 
     if len(targets) == 0:
         raise ValueError("Target list cannot be empty")
+    if jobs < 0:
+        raise ValueError("jobs must be non-negative")
 
-    results = []
-    for i, target in enumerate(targets):
-        alignment = smith_waterman(query, target, scoring)
-        results.append((i, alignment))
+    workers = min(jobs or os.cpu_count() or 1, len(targets))
+    if jobs == 0:
+        cells = len(query) * sum(len(target) for target in targets)
+        if cells < _PARALLEL_MIN_CELLS:
+            workers = 1
 
-    return results
+    if workers <= 1:
+        return [(i, smith_waterman(query, target, scoring)) for i, target in enumerate(targets)]
+
+    tasks = [
+        (query.bases, target.bases, query.seq_type, target.seq_type, scoring)
+        for target in targets
+    ]
+    chunksize = max(1, len(tasks) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(enumerate(executor.map(_align_one, tasks, chunksize=chunksize)))
 
 
 def find_best_alignment(
     query: Sequence,
     targets: List[Sequence],
-    scoring: Optional[ScoringMatrix] = None
+    scoring: Optional[ScoringMatrix] = None,
+    jobs: int = 0
 ) -> Optional[Tuple[int, Alignment]]:
     """
     Find the best alignment among multiple targets.
@@ -691,7 +1034,7 @@ def find_best_alignment(
           requires query.is_valid()
           requires targets.len() > 0
     """
-    alignments = align_against_multiple(query, targets, scoring)
+    alignments = align_against_multiple(query, targets, scoring, jobs)
 
     if not alignments:
         return None
@@ -19,11 +19,157 @@ Python relies on runtime validation:
             raise ValueError(...)
 """
 
-from typing import Dict, List, Tuple, Optional
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple, Optional, Union
 from dataclasses import dataclass, field
 from collections import defaultdict
 
-from .sequence import Sequence
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional (pip install bioflow[numpy])
+    np = None
+
+from .sequence import Sequence, SequenceType
+
+
+# 2-bit base codes for packed k-mer counting; N (and anything else) maps to 4
+_ENCODE_TABLE = bytes({65: 0, 67: 1, 71: 2, 84: 3}.get(b, 4) for b in range(256))
+
+# Largest k whose 2-bit packed form fits in a uint64
+_MAX_PACKED_K = 32
+
+# Largest k for a dense 4**k count array (16M counters, 128 MB)
+_MAX_DENSE_K = 12
+
+# Largest k for a 4**k-bit presence bitset (8 MB)
+_MAX_BITSET_K = 13
+
+# Pairwise k-mer set comparisons use bitsets while 4**k is at most this
+# many times the combined sequence length; beyond that, allocating and
+# scanning mostly-empty bitsets costs more than hashing the k-mers
+_BITSET_BITS_PER_BASE = 64
+
+# (shift, mask) pairs that reverse the order of 2-bit groups in a 64-bit word
+_REVERSE_STEPS = (
+    (2, 0x3333333333333333),
+    (4, 0x0F0F0F0F0F0F0F0F),
+    (8, 0x00FF00FF00FF00FF),
+    (16, 0x0000FFFF0000FFFF),
+    (32, 0x00000000FFFFFFFF),
+)
+
+_DNA_COMPLEMENT = str.maketrans('ACGT', 'TGCA')
+
+# Below this many bases in a batch, starting worker processes costs more
+# than the counting they would take over (~0.14 s per Mbp at k=5)
+_PARALLEL_MIN_BASES = 1 << 20
+
+
+def _pack(seq_bytes: bytes):
+    """Encode ASCII DNA as a uint8 array of 2-bit base codes (4 for N)."""
+    return np.frombuffer(seq_bytes.translate(_ENCODE_TABLE), dtype=np.uint8)
+
+
+def _window_codes(bases, k: int):
+    """
+    Return the 2-bit packed code and start position of every k-mer window
+    of a base-code array (see _pack) that contains only A, C, G and T.
+
+    Each code is built with k ((code << 2) | base) passes over the array;
+    windows containing any other base are dropped via a running count of
+    invalid bases.
+    """
+    n = bases.shape[0] - k + 1
+    if n <= 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty.astype(np.uint64), empty
+
+    invalid = np.concatenate(([0], np.cumsum(bases > 3)))
+    valid = np.flatnonzero(invalid[k:] == invalid[:n])
+
+    wide = bases.astype(np.uint64)
+    codes = np.zeros(n, dtype=np.uint64)
+    for i in range(k):
+        codes = (codes << np.uint64(2)) | wide[i:i + n]
+    return codes[valid], valid
+
+
+def _revcomp2bit(code, k: int):
+    """
+    Reverse complement of 2-bit packed k-mer code(s).
+
+    Works on a Python int or a uint64 array: the 2-bit groups are reversed
+    with five swap-and-mask steps, shifted down to the low 2k bits, and
+    complemented (A<->T is 0<->3, C<->G is 1<->2, i.e. bitwise NOT).
+    """
+    if np is not None and isinstance(code, np.ndarray):
+        cast = np.uint64
+    else:
+        cast = int
+
+    for shift, mask in _REVERSE_STEPS:
+        shift, mask = cast(shift), cast(mask)
+        code = ((code >> shift) & mask) | ((code & mask) << shift)
+    code = code >> cast(64 - 2 * k)
+    return ~code & cast((1 << (2 * k)) - 1)
+
+
+def _count_packed(bases, k: int) -> Tuple[List[int], List[int]]:
+    """
+    Count k-mers of a base-code array using 2-bit packed uint64 windows.
+
+    Returns:
+        (start positions, counts) for each distinct k-mer, ordered by
+        first occurrence. A k-mer string is sequence[start:start + k].
+    """
+    codes, valid = _window_codes(bases, k)
+    _, first, counts = np.unique(codes, return_index=True, return_counts=True)
+    order = np.argsort(first, kind='stable')
+    return valid[first[order]].tolist(), counts[order].tolist()
+
+
+def kmer_code(kmer: str) -> int:
+    """
+    Return the 2-bit packed code of a DNA k-mer (A=0, C=1, G=2, T=3,
+    first base most significant), i.e. its index in count_kmers_fast.
+    """
+    code = 0
+    for base in kmer.upper().encode('ascii').translate(_ENCODE_TABLE):
+        if base > 3:
+            raise ValueError(f"K-mer {kmer!r} contains a non-ACGT base")
+        code = (code << 2) | base
+    return code
+
+
+def count_kmers_fast(bases: Union[str, Sequence], k: int):
+    """
+    Count every DNA k-mer into a dense array of length 4**k.
+
+    counts[kmer_code(kmer)] is the number of occurrences of kmer; windows
+    containing N (or any non-ACGT base) are skipped. A Sequence reuses its
+    cached codes instead of re-encoding; those fold U onto T, so an RNA
+    k-mer such as ACGU is counted under kmer_code("ACGT"). Requires NumPy.
+
+    Aria equivalent:
+        fn count_kmers_fast(bases: String, k: Int) -> [Int]
+          requires k > 0 and k <= 12
+          ensures result.len() == 4.pow(k)
+    """
+    if np is None:
+        raise ImportError("count_kmers_fast requires NumPy (pip install bioflow[numpy])")
+    if k <= 0:
+        raise ValueError("K must be positive")
+    if k > _MAX_DENSE_K:
+        raise ValueError(f"K must be at most {_MAX_DENSE_K} for a dense count array")
+
+    if isinstance(bases, Sequence):
+        encoded = bases.codes
+    else:
+        encoded = _pack(bases.upper().encode('ascii'))
+
+    codes, _ = _window_codes(encoded, k)
+    return np.bincount(codes.astype(np.int64), minlength=4 ** k)
 
 
 @dataclass
@@ -148,15 +294,45 @@ class KMerCounter:
         Count all k-mers in a sequence string.
 
         This is the main counting function using the sliding window approach.
+        With NumPy, plain DNA (ACGTN) is counted as 2-bit packed uint64
+        windows (N-containing windows dropped by one cumulative-sum mask) and
+        only each distinct k-mer is sliced back into a string.
         """
         sequence = sequence.upper()
-        for i in range(len(sequence) - self.k + 1):
-            kmer = sequence[i:i + self.k]
-            if 'N' not in kmer:  # Skip k-mers containing ambiguous bases
-                self.add(kmer)
+        if (np is not None and self.k <= _MAX_PACKED_K and sequence.isascii()
+                and not sequence.encode('ascii').translate(None, b'ACGTN')):
+            self._add_packed(sequence, _pack(sequence.encode('ascii')))
+            return
+
+        # Skip k-mers containing ambiguous bases by only sliding within the
+        # N-free segments, instead of testing every window for 'N'
+        k = self.k
+        counts = self.counts
+        total = 0
+        for segment in sequence.split('N'):
+            windows = len(segment) - k + 1
+            for i in range(windows):
+                kmer = segment[i:i + k]
+                counts[kmer] = counts.get(kmer, 0) + 1
+            if windows > 0:
+                total += windows
+        self.total_kmers += total
+
+    def _add_packed(self, sequence: str, bases) -> None:
+        """Add the k-mers of sequence, given its base-code array."""
+        k = self.k
+        counts = self.counts
+        starts, occurrences = _count_packed(bases, k)
+        for start, count in zip(starts, occurrences):
+            kmer = sequence[start:start + k]
+            counts[kmer] = counts.get(kmer, 0) + count
+        self.total_kmers += sum(occurrences)
 
     def count_from_sequence(self, sequence: Sequence) -> None:
         """Count all k-mers from a Sequence object."""
+        if np is not None and sequence.seq_type == SequenceType.DNA and self.k <= _MAX_PACKED_K:
+            self._add_packed(sequence.bases, sequence.codes)
+            return
         self.count_kmers(sequence.bases)
 
     def get_count(self, kmer: str) -> int:
@@ -266,6 +442,112 @@ class KMerCounter:
         return f"KMerCounter {{ k: {self.k}, unique: {self.unique_count()}, total: {self.total_kmers} }}"
 
 
+def _popcount(bits) -> int:
+    """Number of set bits in a uint8 array."""
+    if hasattr(np, 'bitwise_count'):  # NumPy 2.0+
+        return int(np.bitwise_count(bits).sum())
+    return int(np.unpackbits(bits).sum())
+
+
+@dataclass
+class KMerBitset:
+    """
+    Presence set of DNA k-mers as a 4**k-bit bitset.
+
+    Bit kmer_code(kmer) is set when the k-mer occurs, so set algebra
+    between two sequences is a bytewise AND/OR plus a popcount instead of
+    hashing k-mer strings. Requires NumPy.
+
+    Aria equivalent:
+        struct KMerBitset
+          k: Int
+          bits: [UInt8]
+          invariant self.k > 0 and self.k <= 13
+          invariant self.bits.len() * 8 >= 4.pow(self.k)
+    """
+    k: int
+    bits: 'np.ndarray'
+
+    @classmethod
+    def from_sequence(cls, sequence: Sequence, k: int) -> 'KMerBitset':
+        """
+        Build the presence bitset of a sequence's N-free k-mers.
+
+        RNA U is folded onto T (via Sequence.codes), so RNA and DNA
+        sequences share one k-mer space.
+
+        Aria equivalent:
+            fn from_sequence(sequence: Sequence, k: Int) -> KMerBitset
+              requires k > 0 and k <= 13
+        """
+        if np is None:
+            raise ImportError("KMerBitset requires NumPy (pip install bioflow[numpy])")
+        if k <= 0:
+            raise ValueError("K must be positive")
+        if k > _MAX_BITSET_K:
+            raise ValueError(f"K must be at most {_MAX_BITSET_K} for a k-mer bitset")
+
+        codes, _ = _window_codes(sequence.codes, k)
+        codes = np.unique(codes).astype(np.int64)
+
+        # Same bit order as np.packbits: code 0 is the high bit of byte 0
+        bits = np.zeros(max(1, 4 ** k // 8), dtype=np.uint8)
+        np.bitwise_or.at(bits, codes >> 3, (128 >> (codes & 7)).astype(np.uint8))
+        return cls(k=k, bits=bits)
+
+    def _check_k(self, other: 'KMerBitset') -> None:
+        """Bitsets of different k index different k-mer spaces."""
+        if self.k != other.k:
+            raise ValueError("K values must match")
+
+    def __len__(self) -> int:
+        return _popcount(self.bits)
+
+    def intersection(self, other: 'KMerBitset') -> 'KMerBitset':
+        """K-mers present in both sets."""
+        self._check_k(other)
+        return KMerBitset(k=self.k, bits=self.bits & other.bits)
+
+    def intersection_count(self, other: 'KMerBitset') -> int:
+        """Number of k-mers present in both sets."""
+        self._check_k(other)
+        return _popcount(self.bits & other.bits)
+
+    def union_count(self, other: 'KMerBitset') -> int:
+        """Number of k-mers present in either set."""
+        self._check_k(other)
+        return _popcount(self.bits | other.bits)
+
+    def jaccard_distance(self, other: 'KMerBitset') -> float:
+        """
+        Jaccard distance 1 - |A & B| / |A | B|.
+
+        Aria equivalent:
+            fn jaccard_distance(self, other: KMerBitset) -> Float
+              requires self.k == other.k
+              ensures result >= 0.0 and result <= 1.0
+        """
+        union = self.union_count(other)
+        if union == 0:
+            return 0.0
+        return 1.0 - (self.intersection_count(other) / union)
+
+    def kmers(self) -> List[str]:
+        """Decode the set k-mers, in lexicographic order."""
+        k = self.k
+        codes = np.flatnonzero(np.unpackbits(self.bits)[:4 ** k]).astype(np.uint64)
+        shifts = np.arange(2 * (k - 1), -1, -2, dtype=np.uint64)
+        letters = np.frombuffer(b'ACGT', dtype=np.uint8)[(codes[:, None] >> shifts) & np.uint64(3)]
+        text = letters.tobytes().decode('ascii')
+        return [text[i:i + k] for i in range(0, len(text), k)]
+
+    def __eq__(self, other: object) -> bool:
+        """Check equality: same k and the same set bits."""
+        if not isinstance(other, KMerBitset):
+            return NotImplemented
+        return self.k == other.k and np.array_equal(self.bits, other.bits)
+
+
 def count_kmers(sequence: Sequence, k: int) -> KMerCounter:
     """
     Count all k-mers in a sequence.
@@ -287,6 +569,46 @@ def count_kmers(sequence: Sequence, k: int) -> KMerCounter:
     return counter
 
 
+def _count_one(args: Tuple[str, SequenceType, int]) -> KMerCounter:
+    """
+    Count one sequence's k-mers (module-level so worker processes can pickle it).
+
+    Tasks carry plain base strings rather than Sequence objects, so cached
+    bytes and code arrays are not pickled to the workers.
+    """
+    bases, seq_type, k = args
+    return count_kmers(Sequence._unchecked(bases, seq_type), k)
+
+
+def count_kmers_batch(sequences: List[Sequence], k: int, jobs: int = 0) -> List[KMerCounter]:
+    """
+    Count k-mers for each sequence in a batch.
+
+    Sequences are independent, so they are spread over a process pool.
+    jobs=1 forces serial counting; jobs=0 uses one worker per CPU, but only
+    when the batch is large enough to repay starting the pool.
+
+    Aria equivalent:
+        fn count_kmers_batch(sequences: [Sequence], k: Int) -> [KMerCounts]
+          requires k > 0
+          ensures result.len() == sequences.len()
+    """
+    if jobs < 0:
+        raise ValueError("jobs must be non-negative")
+
+    workers = min(jobs or os.cpu_count() or 1, len(sequences))
+    if jobs == 0 and sum(len(seq) for seq in sequences) < _PARALLEL_MIN_BASES:
+        workers = 1
+
+    if workers <= 1:
+        return [count_kmers(seq, k) for seq in sequences]
+
+    tasks = [(seq.bases, seq.seq_type, k) for seq in sequences]
+    chunksize = max(1, len(tasks) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_count_one, tasks, chunksize=chunksize))
+
+
 def most_frequent_kmers(sequence: Sequence, k: int, n: int) -> List[Tuple[str, int]]:
     """
     Return the n most frequent k-mers.
@@ -312,6 +634,15 @@ def kmer_spectrum(sequence: Sequence, k: int) -> List[Tuple[int, int]]:
         fn kmer_spectrum(sequence: Sequence, k: Int) -> [(Int, Int)]
           requires k > 0 and k <= sequence.len()
     """
+    if np is not None and sequence.seq_type == SequenceType.DNA and k <= _MAX_DENSE_K:
+        if k <= 0:
+            raise ValueError("K must be positive")
+        if k > len(sequence):
+            raise ValueError("K cannot exceed sequence length")
+        spectrum = np.bincount(count_kmers_fast(sequence, k))
+        counts = np.flatnonzero(spectrum[1:]) + 1
+        return list(zip(counts.tolist(), spectrum[counts].tolist()))
+
     counter = count_kmers(sequence, k)
 
     # Build spectrum (count -> number of k-mers with that count)
@@ -353,14 +684,41 @@ def kmer_distance(seq1: Sequence, seq2: Sequence, k: int) -> float:
     if k > len(seq1) or k > len(seq2):
         raise ValueError("K cannot exceed sequence lengths")
 
-    counter1 = count_kmers(seq1, k)
-    counter2 = count_kmers(seq2, k)
+    if _use_bitsets(seq1, seq2, k):
+        bits1 = KMerBitset.from_sequence(seq1, k)
+        return bits1.jaccard_distance(KMerBitset.from_sequence(seq2, k))
 
-    set1 = set(counter1.counts.keys())
-    set2 = set(counter2.counts.keys())
+    return kmer_distance_from_counts(count_kmers(seq1, k), count_kmers(seq2, k))
 
-    intersection = len(set1 & set2)
-    union = len(set1 | set2)
+
+def _use_bitsets(seq1: Sequence, seq2: Sequence, k: int) -> bool:
+    """Whether a pairwise comparison should go through KMerBitset."""
+    return (np is not None
+            and seq1.seq_type == SequenceType.DNA and seq2.seq_type == SequenceType.DNA
+            and k <= _MAX_BITSET_K
+            and 4 ** k <= _BITSET_BITS_PER_BASE * (len(seq1) + len(seq2)))
+
+
+def kmer_distance_from_counts(counts1: KMerCounter, counts2: KMerCounter) -> float:
+    """
+    Calculate Jaccard k-mer distance from two precomputed counters.
+
+    Lets callers comparing many sequences count each one once and reuse
+    the counters for every pair, instead of recounting inside kmer_distance.
+
+    Aria equivalent:
+        fn kmer_distance_from_counts(counts1: KMerCounts, counts2: KMerCounts) -> Float
+          requires counts1.k == counts2.k
+          ensures result >= 0.0 and result <= 1.0
+    """
+    if counts1.k != counts2.k:
+        raise ValueError("K values must match")
+
+    keys1 = counts1.counts.keys()
+    keys2 = counts2.counts.keys()
+
+    intersection = len(keys1 & keys2)
+    union = len(keys1) + len(keys2) - intersection
 
     if union == 0:
         return 0.0
@@ -377,6 +735,10 @@ def shared_kmers(seq1: Sequence, seq2: Sequence, k: int) -> List[str]:
           requires k > 0
           requires k <= seq1.len() and k <= seq2.len()
     """
+    if k > 0 and k <= len(seq1) and k <= len(seq2) and _use_bitsets(seq1, seq2, k):
+        bits1 = KMerBitset.from_sequence(seq1, k)
+        return bits1.intersection(KMerBitset.from_sequence(seq2, k)).kmers()
+
     counter1 = count_kmers(seq1, k)
     counter2 = count_kmers(seq2, k)
 
@@ -402,6 +764,25 @@ def count_kmers_canonical(sequence: Sequence, k: int) -> KMerCounter:
 
     counter = KMerCounter.new(k)
 
+    if np is not None and sequence.seq_type == SequenceType.DNA and k <= _MAX_PACKED_K:
+        # Codes order like the strings (A < C < G < T), so the smaller of a
+        # code and its reverse complement is the canonical k-mer.
+        bases = sequence.bases
+        codes, valid = _window_codes(sequence.codes, k)
+        canonical = np.minimum(codes, _revcomp2bit(codes, k))
+        _, first, counts = np.unique(canonical, return_index=True, return_counts=True)
+        order = np.argsort(first, kind='stable')
+        first = first[order]
+        is_forward = (canonical[first] == codes[first]).tolist()
+
+        for start, forward, count in zip(valid[first].tolist(), is_forward, counts[order].tolist()):
+            kmer = bases[start:start + k]
+            if not forward:
+                kmer = kmer.translate(_DNA_COMPLEMENT)[::-1]
+            counter.counts[kmer] = count
+        counter.total_kmers = len(codes)
+        return counter
+
     for i in range(len(sequence.bases) - k + 1):
         kmer_str = sequence.bases[i:i + k]
 
@@ -448,10 +829,25 @@ def kmer_positions(sequence: Sequence, kmer: str) -> List[int]:
         raise ValueError("K-mer cannot be longer than sequence")
 
     kmer = kmer.upper()
-    positions = []
 
-    for i in range(len(sequence.bases) - len(kmer) + 1):
-        if sequence.bases[i:i + len(kmer)] == kmer:
-            positions.append(i)
+    if (np is not None and sequence.seq_type == SequenceType.DNA
+            and len(kmer) <= _MAX_PACKED_K and kmer.isascii()
+            and not kmer.encode('ascii').translate(None, b'ACGTN')):
+        # One vectorised equality pass per k-mer base over the cached codes
+        codes = sequence.codes
+        target = _pack(kmer.encode('ascii')).tolist()
+        n = codes.shape[0] - len(target) + 1
+        matches = codes[:n] == target[0]
+        for i in range(1, len(target)):
+            matches &= codes[i:i + n] == target[i]
+        return np.flatnonzero(matches).tolist()
+
+    # str.find skips ahead in C; restarting one past each hit keeps overlaps
+    bases = sequence.bases
+    positions = []
+    i = bases.find(kmer)
+    while i != -1:
+        positions.append(i)
+        i = bases.find(kmer, i + 1)
 
     return positions
@@ -19,10 +19,29 @@ Python relies on runtime checks only:
             raise SequenceError(...)
 """
 
+import sys
+import types
 from typing import Optional, List, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional (pip install bioflow[numpy])
+    np = None
+
+try:
+    import stringzilla as sz
+except ImportError:  # StringZilla is optional (pip install bioflow[stringzilla])
+    sz = None
+
+from . import _numba_kernels as _kernels
+
+try:
+    from . import _seqcore
+except ImportError:  # compiled only when Cython is present at install time
+    _seqcore = None
+
 
 class SequenceType(Enum):
     """Type of biological sequence."""
@@ -61,8 +80,97 @@ class InvalidLengthError(SequenceError):
 VALID_DNA_BASES = {'A', 'C', 'G', 'T', 'N'}
 VALID_RNA_BASES = {'A', 'C', 'G', 'U', 'N'}
 
+# Byte forms of the valid bases, for C-level checks via bytes.translate
+_VALID_DNA_BYTES = b'ACGTN'
+_VALID_RNA_BYTES = b'ACGUN'
 
-@dataclass
+# Complement translation table (A<->T, C<->G, N->N)
+_DNA_COMPLEMENT = str.maketrans('ACGTN', 'TGCAN')
+
+# Transcription table (T -> U)
+_DNA_TO_RNA = str.maketrans('T', 'U')
+
+# 2-bit base codes for Sequence.codes: A=0, C=1, G=2, T/U=3, N (and anything else)=4
+_BASE_CODES = bytes({65: 0, 67: 1, 71: 2, 84: 3, 85: 3}.get(b, 4) for b in range(256))
+
+# The Numba SWAR base counter beats five str.count scans from here on
+_NUMBA_COUNT_MIN_LENGTH = 1 << 12
+
+# From here on the one-pass Numba reverse complement beats translate + slice
+_NUMBA_REVCOMP_MIN_LENGTH = 1 << 16
+
+# Below this length str.count beats encoding to codes for np.bincount
+_BINCOUNT_MIN_LENGTH = 1 << 12
+
+# Below this length str.replace's memchr-driven scan beats a translate
+# table for T -> U; past it replace slows sharply and translate wins
+_REPLACE_TRANSCRIBE_MAX_LENGTH = 1 << 14
+
+# Short motifs hit often enough that a vectorized scan beats a str.find walk
+# (one Python iteration per hit) on sequences at least this long
+_VECTOR_MOTIF_MIN_LENGTH = 1 << 13
+_VECTOR_MOTIF_MAX_LEN = 4
+# StringZilla's SIMD find leaves the vectorized scan ahead only for 1-2 bases
+_VECTOR_MOTIF_MAX_LEN_SZ = 2
+
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+ only)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _reset_bases_caches(seq: 'Sequence', bases: str) -> None:
+    """Drop every cache derived from bases (_hash, _len, _raw, _codes, _counts)."""
+    seq._hash = None
+    seq._len = len(bases)
+    seq._raw = None
+    seq._codes = None
+    seq._counts = None
+
+
+def _reset_hash(seq: 'Sequence', seq_type: 'SequenceType') -> None:
+    """Drop the cached hash, which covers seq_type as well as bases."""
+    seq._hash = None
+
+
+def _dict_accessors(name: str):
+    """Getter and setter for a field stored in the instance __dict__."""
+    def get(self):
+        return self.__dict__[name]
+
+    def put(self, value):
+        self.__dict__[name] = value
+
+    return get, put
+
+
+def _reset_caches_on_assignment(cls):
+    """
+    Route assignment to bases and seq_type through setters that drop the
+    caches derived from them.
+
+    Reads stay a C-level slot (or __dict__) lookup; only writes pay for
+    the reset.
+    """
+    for name, reset, doc in (
+        ('bases', _reset_bases_caches, "The nucleotide sequence (uppercase)"),
+        ('seq_type', _reset_hash, "Type of sequence (DNA, RNA, or UNKNOWN)"),
+    ):
+        slot = cls.__dict__.get(name)
+        if isinstance(slot, types.MemberDescriptorType):
+            get, put = slot.__get__, slot.__set__
+        else:
+            # Unslotted dataclass (Python < 3.10): the field lives in __dict__
+            get, put = _dict_accessors(name)
+
+        def setter(self, value, put=put, reset=reset):
+            put(self, value)
+            reset(self, value)
+
+        setattr(cls, name, property(get, setter, doc=doc))
+    return cls
+
+
+@_reset_caches_on_assignment
+@dataclass(**_DATACLASS_SLOTS)
 class Sequence:
     """
     Represents a validated genomic sequence (DNA or RNA).
@@ -84,14 +192,25 @@ class Sequence:
     description: Optional[str] = None
     seq_type: SequenceType = SequenceType.DNA
     _validated: bool = field(default=False, repr=False)
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _len: int = field(default=0, init=False, repr=False, compare=False)
+    _raw: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _codes: Optional['np.ndarray'] = field(default=None, init=False, repr=False, compare=False)
+    _counts: Optional[Tuple[int, int, int, int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Validate sequence on construction."""
-        # Normalize to uppercase
-        self.bases = self.bases.upper()
+        # Normalize to uppercase (isupper() stops at the first lowercase
+        # character, so already-uppercase input avoids a full copy)
+        if not self.bases.isupper():
+            self.bases = self.bases.upper()
+
+        self._len = len(self.bases)
 
         # Validate non-empty
-        if len(self.bases) == 0:
+        if self._len == 0:
             raise EmptySequenceError("Sequence must have at least one base")
 
         # Validate bases
@@ -99,13 +218,79 @@ class Sequence:
             self._validate()
             self._validated = True
 
+    @property
+    def raw(self) -> bytes:
+        """
+        Bases as ASCII bytes.
+
+        Encoded on first access and cached; the byte-level fast paths
+        (codes, base counting, motif scans, k-mer packing) all read this
+        instead of encoding the string again.
+        """
+        if self._raw is None:
+            self._raw = self.bases.encode('ascii')
+        return self._raw
+
+    @property
+    def codes(self) -> 'np.ndarray':
+        """
+        Bases as a read-only uint8 array of codes (A=0, C=1, G=2, T/U=3, N=4).
+
+        Encoded on first access and cached, so k-mer kernels called on the
+        same sequence repeatedly share one encoding. Requires NumPy.
+        """
+        if self._codes is None:
+            if np is None:
+                raise ImportError("Sequence.codes requires NumPy (pip install bioflow[numpy])")
+            self._codes = np.frombuffer(self.raw.translate(_BASE_CODES), dtype=np.uint8)
+        return self._codes
+
     def _validate(self) -> None:
-        """Validate all bases in the sequence."""
-        valid_bases = VALID_DNA_BASES if self.seq_type != SequenceType.RNA else VALID_RNA_BASES
+        """
+        Validate all bases in the sequence.
+
+        bytes.translate deletes every valid base in one C pass; whatever
+        survives is invalid, in order, so its first byte locates the
+        offending position. The encoded bytes are not kept: raw stays lazy,
+        so sequences that never reach a byte-level path hold no second copy.
+        """
+        valid = _VALID_RNA_BYTES if self.seq_type == SequenceType.RNA else _VALID_DNA_BYTES
+        try:
+            raw = self.bases.encode('ascii')
+        except UnicodeEncodeError:
+            # Non-ASCII input is always invalid; find the first bad character
+            valid_bases = VALID_RNA_BASES if self.seq_type == SequenceType.RNA else VALID_DNA_BASES
+            for i, base in enumerate(self.bases):
+                if base not in valid_bases:
+                    raise InvalidBaseError(i, base)
+
+        invalid = raw.translate(None, valid)
+        if invalid:
+            position = raw.index(invalid[:1])
+            raise InvalidBaseError(position, self.bases[position])
+
+    @classmethod
+    def _unchecked(
+        cls,
+        bases: str,
+        seq_type: SequenceType,
+        id: Optional[str] = None,
+        description: Optional[str] = None
+    ) -> 'Sequence':
+        """
+        Build a sequence from bases already known to be valid and uppercase.
 
-        for i, base in enumerate(self.bases):
-            if base not in valid_bases:
-                raise InvalidBaseError(i, base)
+        Used for results derived from an existing Sequence (complement,
+        slices, concatenation, ...): __post_init__ is skipped entirely, so
+        neither the uppercase check nor validation rescans the bases.
+        """
+        seq = cls.__new__(cls)
+        seq.bases = bases  # Also sets _len and clears the other caches
+        seq.id = id
+        seq.description = description
+        seq.seq_type = seq_type
+        seq._validated = True
+        return seq
 
     @classmethod
     def new(cls, bases: str) -> 'Sequence':
@@ -142,6 +327,31 @@ class Sequence:
             seq_type=seq_type
         )
 
+    @classmethod
+    def from_many(
+        cls,
+        bases_list: List[str],
+        seq_type: SequenceType = SequenceType.DNA
+    ) -> List['Sequence']:
+        """
+        Create many sequences with one batched validation pass.
+
+        All inputs are joined and checked with a single bytes.translate
+        call, so the per-sequence validation loop is skipped when the whole
+        batch is valid. If anything is invalid, sequences are built one by
+        one so the error reports the exact offending base and position.
+        """
+        valid = _VALID_RNA_BYTES if seq_type == SequenceType.RNA else _VALID_DNA_BYTES
+        try:
+            batch_valid = not ''.join(bases_list).upper().encode('ascii').translate(None, valid)
+        except UnicodeEncodeError:
+            batch_valid = False
+
+        return [
+            cls(bases=bases, seq_type=seq_type, _validated=batch_valid)
+            for bases in bases_list
+        ]
+
     def is_valid(self) -> bool:
         """
         Check if all bases are valid for the sequence type.
@@ -154,7 +364,7 @@ class Sequence:
 
     def __len__(self) -> int:
         """Return the length of the sequence."""
-        return len(self.bases)
+        return self._len
 
     def len(self) -> int:
         """
@@ -164,14 +374,23 @@ class Sequence:
             fn len(self) -> Int
               ensures result > 0
         """
-        return len(self.bases)
+        return self._len
 
     def has_ambiguous(self) -> bool:
         """Check if the sequence contains any ambiguous bases (N)."""
+        if self._counts is not None:
+            return self._counts[4] > 0
         return 'N' in self.bases
 
     def count_ambiguous(self) -> int:
-        """Count the number of ambiguous bases."""
+        """
+        Count the number of ambiguous bases.
+
+        Reads the cached base_counts when they exist; otherwise a single
+        str.count is cheaper than counting every base.
+        """
+        if self._counts is not None:
+            return self._counts[4]
         return self.bases.count('N')
 
     def base_at(self, index: int) -> Optional[str]:
@@ -184,7 +403,7 @@ class Sequence:
         """
         if index < 0:
             raise ValueError("Index must be non-negative")
-        if index >= len(self.bases):
+        if index >= self._len:
             return None
         return self.bases[index]
 
@@ -203,15 +422,17 @@ class Sequence:
             raise ValueError("Start index must be non-negative")
         if end <= start:
             raise ValueError("End must be greater than start")
-        if end > len(self.bases):
+        if end > self._len:
             raise ValueError("End must not exceed sequence length")
 
-        return Sequence(
-            bases=self.bases[start:end],
-            id=self.id,
-            description=self.description,
-            seq_type=self.seq_type
+        sub = Sequence._unchecked(
+            self.bases[start:end], self.seq_type,
+            id=self.id, description=self.description
         )
+        if self._codes is not None:
+            # Zero-copy: a read-only view into the parent's code array
+            sub._codes = self._codes[start:end]
+        return sub
 
     @staticmethod
     def complement_base(c: str) -> str:
@@ -240,14 +461,15 @@ class Sequence:
         if self.seq_type != SequenceType.DNA:
             raise ValueError("Complement only available for DNA sequences")
 
-        comp_bases = ''.join(self.complement_base(b) for b in self.bases)
-        return Sequence(
-            bases=comp_bases,
-            id=self.id,
-            description=self.description,
-            seq_type=self.seq_type,
-            _validated=True  # Skip validation since we know it's valid
+        # One C-level pass over the translation table instead of a
+        # dict lookup and join per base.
+        comp_bases = self.bases.translate(_DNA_COMPLEMENT)
+        comp = Sequence._unchecked(
+            comp_bases, self.seq_type,
+            id=self.id, description=self.description
         )
+        comp._counts = _complement_counts(self._counts)
+        return comp
 
     def reverse(self) -> 'Sequence':
         """
@@ -258,13 +480,13 @@ class Sequence:
               ensures result.len() == self.len()
               ensures result.is_valid()
         """
-        return Sequence(
-            bases=self.bases[::-1],
-            id=self.id,
-            description=self.description,
-            seq_type=self.seq_type,
-            _validated=True
+        reversed_seq = Sequence._unchecked(
+            self.bases[::-1], self.seq_type,
+            id=self.id, description=self.description
         )
+        # Same composition, so cached base counts carry over unchanged
+        reversed_seq._counts = self._counts
+        return reversed_seq
 
     def reverse_complement(self) -> 'Sequence':
         """
@@ -280,7 +502,29 @@ class Sequence:
         if self.seq_type != SequenceType.DNA:
             raise ValueError("Reverse complement only available for DNA sequences")
 
-        return self.complement().reverse()
+        # Compiled kernels write complements back to front in one pass, and
+        # the result's raw bytes come for free
+        rc_raw = None
+        if _seqcore is not None:
+            rc_raw = _seqcore.reverse_complement(self.raw)
+        elif self._len >= _NUMBA_REVCOMP_MIN_LENGTH and _kernels.NUMBA_AVAILABLE:
+            rc_raw = _kernels.reverse_complement_u8(_kernels.as_u8(self.raw)).tobytes()
+
+        if rc_raw is not None:
+            rc = Sequence._unchecked(
+                rc_raw.decode('ascii'), self.seq_type,
+                id=self.id, description=self.description
+            )
+            rc._raw = rc_raw
+        else:
+            # Fused complement + reverse: no intermediate complemented Sequence.
+            rc = Sequence._unchecked(
+                self.bases.translate(_DNA_COMPLEMENT)[::-1], self.seq_type,
+                id=self.id, description=self.description
+            )
+
+        rc._counts = _complement_counts(self._counts)
+        return rc
 
     def gc_content(self) -> float:
         """
@@ -294,10 +538,10 @@ class Sequence:
         In Aria, the contract guarantees the result is in [0, 1].
         In Python, we rely on the algorithm being correct.
         """
-        if len(self.bases) == 0:
+        if self._len == 0:
             return 0.0
-        gc_count = sum(1 for b in self.bases if b in 'GC')
-        return gc_count / len(self.bases)
+        _, c_count, g_count, _, _ = self.base_counts()
+        return (g_count + c_count) / self._len
 
     def at_content(self) -> float:
         """
@@ -312,15 +556,18 @@ class Sequence:
         if self.seq_type != SequenceType.DNA:
             raise ValueError("AT content only available for DNA sequences")
 
-        if len(self.bases) == 0:
+        if self._len == 0:
             return 0.0
-        at_count = sum(1 for b in self.bases if b in 'AT')
-        return at_count / len(self.bases)
+        a_count, _, _, t_count, _ = self.base_counts()
+        return (a_count + t_count) / self._len
 
     def base_counts(self) -> Tuple[int, int, int, int, int]:
         """
         Count occurrences of each base.
 
+        Counted in one pass and cached, so gc_content, at_content and
+        base_counts on the same sequence share a single walk of the bases.
+
         Returns:
             Tuple of (A_count, C_count, G_count, T_count, N_count)
 
@@ -329,17 +576,32 @@ class Sequence:
               requires self.is_valid()
               ensures result.0 + result.1 + result.2 + result.3 + result.4 == self.len()
         """
-        a_count = self.bases.count('A')
-        c_count = self.bases.count('C')
-        g_count = self.bases.count('G')
-        # Count T for DNA, U for RNA (both counted as t_count)
-        t_count = self.bases.count('T') + self.bases.count('U')
-        n_count = self.bases.count('N')
+        if self._counts is not None:
+            return self._counts
+
+        if self._len >= _NUMBA_COUNT_MIN_LENGTH and _kernels.NUMBA_AVAILABLE:
+            # One compiled pass, eight bases per word, instead of five str.count scans
+            a_count, c_count, g_count, t_count, n_count = \
+                _kernels.count_bases_u8(_kernels.as_u8(self.raw))
+        elif _seqcore is not None:
+            a_count, c_count, g_count, t_count, n_count = _seqcore.count_bases(self.raw)
+        elif np is not None and (self._codes is not None or self._len >= _BINCOUNT_MIN_LENGTH):
+            # Codes already fold T/U together and map N to 4
+            a_count, c_count, g_count, t_count, n_count = \
+                np.bincount(self.codes, minlength=5).tolist()
+        else:
+            a_count = self.bases.count('A')
+            c_count = self.bases.count('C')
+            g_count = self.bases.count('G')
+            # Count T for DNA, U for RNA (both counted as t_count)
+            t_count = self.bases.count('T') + self.bases.count('U')
+            n_count = self.bases.count('N')
 
         # In Aria, this postcondition is verified at compile time
-        assert a_count + c_count + g_count + t_count + n_count == len(self.bases)
+        assert a_count + c_count + g_count + t_count + n_count == self._len
 
-        return (a_count, c_count, g_count, t_count, n_count)
+        self._counts = (a_count, c_count, g_count, t_count, n_count)
+        return self._counts
 
     def transcribe(self) -> 'Sequence':
         """
@@ -355,14 +617,18 @@ class Sequence:
         if self.seq_type != SequenceType.DNA:
             raise ValueError("Can only transcribe DNA")
 
-        rna_bases = self.bases.replace('T', 'U')
-        return Sequence(
-            bases=rna_bases,
-            id=self.id,
-            description=self.description,
-            seq_type=SequenceType.RNA,
-            _validated=True
+        # Bases are already uppercase, so only T needs swapping
+        if self._len <= _REPLACE_TRANSCRIBE_MAX_LENGTH:
+            rna_bases = self.bases.replace('T', 'U')
+        else:
+            rna_bases = self.bases.translate(_DNA_TO_RNA)
+        rna = Sequence._unchecked(
+            rna_bases, SequenceType.RNA,
+            id=self.id, description=self.description
         )
+        # base_counts folds T and U together, so the counts are unchanged
+        rna._counts = self._counts
+        return rna
 
     def concat(self, other: 'Sequence') -> 'Sequence':
         """
@@ -376,13 +642,41 @@ class Sequence:
         if self.seq_type != other.seq_type:
             raise ValueError("Cannot concatenate different sequence types")
 
-        return Sequence(
-            bases=self.bases + other.bases,
-            id=self.id,
-            description=self.description,
-            seq_type=self.seq_type,
-            _validated=True
+        joined = Sequence._unchecked(
+            self.bases + other.bases, self.seq_type,
+            id=self.id, description=self.description
+        )
+        if self._counts is not None and other._counts is not None:
+            joined._counts = tuple(a + b for a, b in zip(self._counts, other._counts))
+        return joined
+
+    @classmethod
+    def concat_all(cls, sequences: List['Sequence']) -> 'Sequence':
+        """
+        Concatenate many sequences in one join.
+
+        Chaining concat in a loop copies the growing prefix every time
+        (quadratic); this copies each input once. The result takes the id
+        and description of the first sequence, as concat does.
+
+        Aria equivalent:
+            fn concat_all(sequences: [Sequence]) -> Sequence
+              requires sequences.len() > 0
+              requires sequences.all(|s| s.seq_type == sequences[0].seq_type)
+        """
+        if len(sequences) == 0:
+            raise ValueError("Sequence list cannot be empty")
+        first = sequences[0]
+        if any(seq.seq_type != first.seq_type for seq in sequences):
+            raise ValueError("Cannot concatenate different sequence types")
+
+        joined = cls._unchecked(
+            ''.join(seq.bases for seq in sequences), first.seq_type,
+            id=first.id, description=first.description
         )
+        if all(seq._counts is not None for seq in sequences):
+            joined._counts = tuple(map(sum, zip(*(seq._counts for seq in sequences))))
+        return joined
 
     def contains_motif(self, motif: str) -> bool:
         """
@@ -395,7 +689,7 @@ class Sequence:
         """
         if len(motif) == 0:
             raise ValueError("Motif cannot be empty")
-        if len(motif) > len(self.bases):
+        if len(motif) > self._len:
             raise ValueError("Motif cannot be longer than sequence")
 
         return motif.upper() in self.bases
@@ -413,11 +707,30 @@ class Sequence:
             raise ValueError("Motif cannot be empty")
 
         motif_upper = motif.upper()
-        positions = []
+        vector_max_len = _VECTOR_MOTIF_MAX_LEN if sz is None else _VECTOR_MOTIF_MAX_LEN_SZ
+
+        if (np is not None and self._len >= _VECTOR_MOTIF_MIN_LENGTH
+                and len(motif_upper) <= vector_max_len):
+            return _find_motif_numpy(self.raw, motif_upper)
+
+        if sz is not None:
+            # StringZilla picks an SSE/AVX/NEON substring search at load time
+            try:
+                needle = motif_upper.encode('ascii')
+            except UnicodeEncodeError:
+                return []  # Bases are ASCII, so a non-ASCII motif never matches
+            find = sz.Str(self.raw).find
+        else:
+            # CPython's C-level two-way/memchr search
+            needle = motif_upper
+            find = self.bases.find
 
-        for i in range(len(self.bases) - len(motif_upper) + 1):
-            if self.bases[i:i + len(motif_upper)] == motif_upper:
-                positions.append(i)
+        # Restart one past each hit so overlapping matches are kept
+        positions = []
+        i = find(needle)
+        while i >= 0:
+            positions.append(i)
+            i = find(needle, i + 1)
 
         return positions
 
@@ -430,12 +743,13 @@ class Sequence:
         else:
             header = ">sequence"
 
-        # Split sequence into 80-character lines
-        lines = [header]
-        for i in range(0, len(self.bases), 80):
-            lines.append(self.bases[i:i + 80])
+        # Split sequence into 80-character lines; the empty last entry gives
+        # the trailing newline without copying the joined text again
+        lines = [self.bases[i:i + 80] for i in range(0, self._len, 80)]
+        lines.insert(0, header)
+        lines.append('')
 
-        return '\n'.join(lines) + '\n'
+        return '\n'.join(lines)
 
     def __str__(self) -> str:
         """Return a string representation."""
@@ -444,11 +758,178 @@ class Sequence:
         return self.bases
 
     def __eq__(self, other: object) -> bool:
-        """Check equality with another sequence."""
+        """
+        Check equality with another sequence.
+
+        Cheapest checks first: identity, length, type; the full bases
+        compare (one memcmp) only runs when those all agree.
+        """
+        if self is other:
+            return True
         if not isinstance(other, Sequence):
+            return NotImplemented
+        if self._len != other._len or self.seq_type != other.seq_type:
             return False
-        return self.bases == other.bases and self.seq_type == other.seq_type
+        return self.bases == other.bases
 
     def __hash__(self) -> int:
-        """Return hash for use in sets and dicts."""
-        return hash((self.bases, self.seq_type))
+        """Return hash for use in sets and dicts (computed once, then cached)."""
+        if self._hash is None:
+            self._hash = hash((self.bases, self.seq_type))
+        return self._hash
+
+    def __reduce__(self):
+        """
+        Pickle only the fields, not the caches.
+
+        The cached hash is only valid in the process (and hash seed) that
+        computed it, and the byte/array caches would bloat the payload.
+        """
+        return (
+            self.__class__._unchecked,
+            (self.bases, self.seq_type, self.id, self.description)
+        )
+
+
+def _complement_counts(
+    counts: Optional[Tuple[int, int, int, int, int]]
+) -> Optional[Tuple[int, int, int, int, int]]:
+    """Base counts of the complement: A<->T and C<->G swap, N stays."""
+    if counts is None:
+        return None
+    a_count, c_count, g_count, t_count, n_count = counts
+    return (t_count, g_count, c_count, a_count, n_count)
+
+
+def _motif_starts(hay: 'np.ndarray', needle: bytes) -> 'np.ndarray':
+    """
+    Overlapping match offsets of needle in a uint8 buffer.
+
+    Offsets whose first and last bytes match are kept as candidates, then
+    narrowed by comparing each inner motif byte at those offsets.
+    """
+    width = len(needle)
+    starts = hay.shape[0] - width + 1
+    if starts <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    candidates = np.flatnonzero(
+        (hay[:starts] == needle[0]) & (hay[width - 1:] == needle[-1])
+    )
+    for k in range(1, width - 1):
+        candidates = candidates[hay[candidates + k] == needle[k]]
+    return candidates
+
+
+def _find_motif_numpy(raw: bytes, motif: str) -> List[int]:
+    """Overlapping motif positions via the vectorized first/last byte filter."""
+    try:
+        needle = motif.encode('ascii')
+    except UnicodeEncodeError:
+        return []  # Bases are ASCII, so a non-ASCII motif never matches
+    return _motif_starts(np.frombuffer(raw, dtype=np.uint8), needle).tolist()
+
+
+@dataclass
+class SequenceBatch:
+    """
+    Structure-of-arrays view over a collection of sequences.
+
+    All bases are stored back to back in one contiguous uint8 buffer, with
+    an int64 offsets array (length N + 1) marking where each sequence
+    starts and ends. Aggregate statistics then become single NumPy
+    reductions over the buffer instead of N separate string walks.
+
+    Requires NumPy.
+
+    Attributes:
+        buf: Concatenated bases as ASCII bytes
+        offsets: Sequence i spans buf[offsets[i]:offsets[i + 1]]
+        ids: Sequence identifiers, in order
+        seq_types: Sequence types, in order
+    """
+    buf: 'np.ndarray'
+    offsets: 'np.ndarray'
+    ids: List[Optional[str]]
+    seq_types: List[SequenceType]
+
+    @classmethod
+    def from_sequences(cls, sequences: List[Sequence]) -> 'SequenceBatch':
+        """Pack sequences into a single contiguous buffer."""
+        if np is None:
+            raise ImportError("SequenceBatch requires NumPy (pip install bioflow[numpy])")
+        if len(sequences) == 0:
+            raise ValueError("Sequence list cannot be empty")
+
+        # Reuse cached bytes but don't cache new ones on the caller's sequences
+        joined = b''.join(
+            seq._raw if seq._raw is not None else seq.bases.encode('ascii')
+            for seq in sequences
+        )
+        offsets = np.zeros(len(sequences) + 1, dtype=np.int64)
+        np.cumsum(
+            np.fromiter((len(seq) for seq in sequences), dtype=np.int64, count=len(sequences)),
+            out=offsets[1:]
+        )
+
+        return cls(
+            buf=np.frombuffer(joined, dtype=np.uint8),
+            offsets=offsets,
+            ids=[seq.id for seq in sequences],
+            seq_types=[seq.seq_type for seq in sequences]
+        )
+
+    def __len__(self) -> int:
+        """Return the number of sequences in the batch."""
+        return len(self.offsets) - 1
+
+    def lengths(self) -> 'np.ndarray':
+        """Return the length of every sequence."""
+        return np.diff(self.offsets)
+
+    def gc_contents(self) -> 'np.ndarray':
+        """Return the GC content of every sequence."""
+        is_gc = (self.buf == ord('G')) | (self.buf == ord('C'))
+        gc_counts = np.add.reduceat(is_gc, self.offsets[:-1], dtype=np.int64)
+        return gc_counts / self.lengths()
+
+    def byte_counts(self) -> 'np.ndarray':
+        """Return a 256-entry histogram of every byte in the batch."""
+        return np.bincount(self.buf, minlength=256)
+
+    def find_motif_positions(self, motif: str) -> List[List[int]]:
+        """
+        Find all (overlapping) motif positions in every sequence.
+
+        One vectorized scan runs over the whole buffer. Matches are then
+        assigned to their sequence by offset, and any match that runs over
+        a sequence boundary is dropped. Positions are relative to each
+        sequence, as in Sequence.find_motif_positions.
+        """
+        if len(motif) == 0:
+            raise ValueError("Motif cannot be empty")
+        try:
+            needle = motif.upper().encode('ascii')
+        except UnicodeEncodeError:
+            return [[] for _ in range(len(self))]
+
+        starts = _motif_starts(self.buf, needle)
+        owner = np.searchsorted(self.offsets, starts, side='right') - 1
+        inside = starts + len(needle) <= self.offsets[owner + 1]
+        starts, owner = starts[inside], owner[inside]
+
+        # Slice one Python list rather than splitting into N small arrays
+        local = (starts - self.offsets[owner]).tolist()
+        ends = np.cumsum(np.bincount(owner, minlength=len(self))).tolist()
+        return [local[begin:end] for begin, end in zip([0] + ends[:-1], ends)]
+
+    def __eq__(self, other: object) -> bool:
+        """Check equality: same buffer, offsets, ids and types."""
+        if not isinstance(other, SequenceBatch):
+            return NotImplemented
+        return (
+            np.array_equal(self.offsets, other.offsets)
+            and np.array_equal(self.buf, other.buf)
+            and self.ids == other.ids
+            and self.seq_types == other.seq_types
+        )
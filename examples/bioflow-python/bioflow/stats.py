@@ -11,7 +11,12 @@ from typing import List, Dict, Tuple
 from dataclasses import dataclass, field
 from collections import Counter
 
-from .sequence import Sequence
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional (pip install bioflow[numpy])
+    np = None
+
+from .sequence import Sequence, SequenceBatch
 from .quality import QualityScores, QualityCategory
 
 
@@ -114,38 +119,60 @@ class SequenceSetStats:
             raise ValueError("Sequence list cannot be empty")
 
         count = len(sequences)
-        lengths = [len(seq) for seq in sequences]
-        total_bases = sum(lengths)
-        min_len = min(lengths)
-        max_len = max(lengths)
-        mean_len = total_bases / count
-
-        # Calculate median
-        sorted_lengths = sorted(lengths)
         mid = count // 2
-        if count % 2 == 0:
-            median_len = (sorted_lengths[mid - 1] + sorted_lengths[mid]) // 2
-        else:
-            median_len = sorted_lengths[mid]
 
-        # Calculate mean GC content
-        gc_sum = sum(seq.gc_content() for seq in sequences)
-        mean_gc = gc_sum / count
+        if np is not None:
+            # Pack once, then every aggregate is a reduction over contiguous arrays
+            batch = SequenceBatch.from_sequences(sequences)
+
+            # One sort feeds min/max, the median and N50
+            sorted_lengths = np.sort(batch.lengths())
+            total_bases = int(sorted_lengths.sum())
+            min_len = int(sorted_lengths[0])
+            max_len = int(sorted_lengths[-1])
+
+            if count % 2 == 0:
+                median_len = int(sorted_lengths[mid - 1] + sorted_lengths[mid]) // 2
+            else:
+                median_len = int(sorted_lengths[mid])
 
-        # Calculate N50 (length where 50% of bases are in longer sequences)
-        sorted_desc = sorted(lengths, reverse=True)
-        half_total = total_bases // 2
-        running_sum = 0
-        n50 = sorted_desc[0]
+            # N50: first length whose running sum (longest first) reaches half
+            sorted_desc = sorted_lengths[::-1].copy()
+            cumulative = np.cumsum(sorted_desc)
+            n50 = int(sorted_desc[int(np.searchsorted(cumulative, total_bases // 2))])
 
-        for length in sorted_desc:
-            running_sum += length
-            if running_sum >= half_total:
-                n50 = length
-                break
+            gc_sum = sum(batch.gc_contents().tolist())
+            total_ambiguous = int(batch.byte_counts()[ord('N')])
+        else:
+            lengths = [len(seq) for seq in sequences]
+            total_bases = sum(lengths)
+            min_len = min(lengths)
+            max_len = max(lengths)
+
+            # Calculate median
+            sorted_lengths = sorted(lengths)
+            if count % 2 == 0:
+                median_len = (sorted_lengths[mid - 1] + sorted_lengths[mid]) // 2
+            else:
+                median_len = sorted_lengths[mid]
+
+            # Calculate N50 (length where 50% of bases are in longer sequences)
+            sorted_desc = sorted(lengths, reverse=True)
+            half_total = total_bases // 2
+            running_sum = 0
+            n50 = sorted_desc[0]
+
+            for length in sorted_desc:
+                running_sum += length
+                if running_sum >= half_total:
+                    n50 = length
+                    break
+
+            gc_sum = sum(seq.gc_content() for seq in sequences)
+            total_ambiguous = sum(seq.count_ambiguous() for seq in sequences)
 
-        # Count total ambiguous bases
-        total_ambiguous = sum(seq.count_ambiguous() for seq in sequences)
+        mean_len = total_bases / count
+        mean_gc = gc_sum / count
 
         return cls(
             count=count,
@@ -306,6 +333,22 @@ class ReadSetStats:
         )
 
 
+def _bin_counts(bin_indices, num_bins: int) -> List[int]:
+    """
+    Count how many values fall in each of num_bins bins.
+
+    Indices past the last bin are clamped into it. With NumPy, bin_indices
+    is an integer array counted by np.bincount; otherwise it is any
+    iterable of ints counted by collections.Counter.
+    """
+    if np is not None:
+        clipped = np.clip(bin_indices, 0, num_bins - 1)
+        return np.bincount(clipped, minlength=num_bins).tolist()
+
+    counts = Counter(min(index, num_bins - 1) for index in bin_indices)
+    return [counts[i] for i in range(num_bins)]
+
+
 @dataclass
 class GCHistogram:
     """
@@ -324,12 +367,13 @@ class GCHistogram:
             raise ValueError("Sequence list cannot be empty")
 
         bin_size = 1.0 / num_bins
-        bins = [0] * num_bins
 
-        for seq in sequences:
-            gc = seq.gc_content()
-            bin_index = min(int(gc / bin_size), num_bins - 1)
-            bins[bin_index] += 1
+        if np is not None:
+            gcs = SequenceBatch.from_sequences(sequences).gc_contents()
+            bin_idx = (gcs / bin_size).astype(np.int64)
+        else:
+            bin_idx = (int(seq.gc_content() / bin_size) for seq in sequences)
+        bins = _bin_counts(bin_idx, num_bins)
 
         return cls(bins=bins, bin_size=bin_size, num_bins=num_bins)
 
@@ -377,11 +421,11 @@ class LengthHistogram:
         length_range = max_len - min_len
         bin_width = max(1, (length_range // num_bins) + 1)
 
-        bins = [0] * num_bins
-
-        for length in lengths:
-            bin_index = min((length - min_len) // bin_width, num_bins - 1)
-            bins[bin_index] += 1
+        if np is not None:
+            bin_idx = (np.asarray(lengths, dtype=np.int64) - min_len) // bin_width
+        else:
+            bin_idx = ((length - min_len) // bin_width for length in lengths)
+        bins = _bin_counts(bin_idx, num_bins)
 
         return cls(
             bins=bins,
@@ -14,8 +14,8 @@ sys.path.insert(0, '..')
 
 from bioflow.sequence import Sequence, SequenceType
 from bioflow.quality import QualityScores, Q_HIGH
-from bioflow.kmer import count_kmers, kmer_distance, kmer_spectrum
-from bioflow.alignment import smith_waterman, needleman_wunsch, ScoringMatrix
+from bioflow.kmer import count_kmers, count_kmers_batch, kmer_distance, kmer_distance_from_counts, kmer_spectrum
+from bioflow.alignment import smith_waterman, needleman_wunsch, ScoringMatrix, score_all_vs_all
 from bioflow.stats import SequenceStats, SequenceSetStats
 
 
@@ -199,12 +199,14 @@ def example_batch_analysis():
     stats = SequenceSetStats.from_sequences(sequences)
     print(f"\n{stats}")
 
+    # Count 5-mers once per sequence; reused by the distance matrix below
+    kmer_counts = count_kmers_batch(sequences, 5)
+
     # Individual sequence analysis
     print("\nPer-sequence analysis:")
     for i, seq in enumerate(sequences):
         gc = seq.gc_content()
-        kmers = count_kmers(seq, 5)
-        print(f"  Seq {i+1}: len={len(seq)}, GC={gc*100:.1f}%, unique 5-mers={kmers.unique_count()}")
+        print(f"  Seq {i+1}: len={len(seq)}, GC={gc*100:.1f}%, unique 5-mers={kmer_counts[i].unique_count()}")
 
     # Compare sequences using k-mer distance
     print("\nK-mer distance matrix (k=5):")
@@ -213,16 +215,30 @@ def example_batch_analysis():
         print(f"  {i+1}  ", end="")
     print()
 
-    for i, seq1 in enumerate(sequences):
+    for i in range(len(sequences)):
         print(f"  {i+1}: ", end="")
-        for j, seq2 in enumerate(sequences):
+        for j in range(len(sequences)):
             if i == j:
                 print(" 0.00", end="")
             else:
-                dist = kmer_distance(seq1, seq2, 5)
+                dist = kmer_distance_from_counts(kmer_counts[i], kmer_counts[j])
                 print(f" {dist:.2f}", end="")
         print()
 
+    # All-vs-all Smith-Waterman scores (one parasail profile per query)
+    scores = score_all_vs_all(sequences)
+    print("\nSmith-Waterman score matrix:")
+    print("     ", end="")
+    for i in range(len(sequences)):
+        print(f"  {i+1}  ", end="")
+    print()
+
+    for i, row in enumerate(scores):
+        print(f"  {i+1}: ", end="")
+        for score in row:
+            print(f" {score:4d}", end="")
+        print()
+
     print()
 
 
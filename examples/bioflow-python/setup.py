@@ -1,6 +1,50 @@
 """Setup script for BioFlow Python package."""
 
-from setuptools import setup, find_packages
+import os
+
+from setuptools import Extension, setup, find_packages
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CCompilerError, ExecError, PlatformError
+
+try:
+    from Cython.Build import cythonize
+except ImportError:  # Cython is optional; alignment falls back to pure Python
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [
+            Extension(
+                f"bioflow.{name}",
+                [f"bioflow/{name}.pyx"],
+                extra_compile_args=[] if os.name == "nt" else ["-O3"],
+            )
+            for name in ("_align", "_seqcore")
+        ],
+        language_level=3,
+    )
+
+
+class optional_build_ext(build_ext):
+    """Build the compiled kernels when possible; otherwise install pure Python."""
+
+    def run(self):
+        try:
+            super().run()
+        except PlatformError as exc:
+            self.warn(f"skipping compiled kernels (no usable compiler): {exc}")
+
+    def build_extensions(self):
+        self.skipped = []
+        super().build_extensions()
+        # Later steps (--inplace copies, install records) only see what built
+        self.extensions = [ext for ext in self.extensions if ext not in self.skipped]
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except (CCompilerError, ExecError, PlatformError) as exc:
+            self.warn(f"skipping {ext.name}, falling back to pure Python: {exc}")
+            self.skipped.append(ext)
 
 setup(
     name="bioflow",
@@ -8,6 +52,8 @@ setup(
     description="Genomic data processing library (Python port for comparison)",
     author="Aria Project",
     packages=find_packages(),
+    ext_modules=ext_modules,
+    cmdclass={"build_ext": optional_build_ext},
     python_requires=">=3.8",
     install_requires=[],
     extras_require={
@@ -18,6 +64,16 @@ setup(
         "numpy": [
             "numpy>=1.20.0",
         ],
+        "numba": [
+            "numpy>=1.20.0",
+            "numba>=0.56.0",
+        ],
+        "parasail": [
+            "parasail>=1.2",
+        ],
+        "stringzilla": [
+            "stringzilla>=3.0",
+        ],
     },
     classifiers=[
         "Development Status :: 3 - Alpha",
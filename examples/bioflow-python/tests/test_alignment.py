@@ -2,13 +2,18 @@
 Tests for the Alignment module.
 """
 
+import os
+import random
+import subprocess
+import sys
+
 import pytest
 from bioflow.sequence import Sequence
 from bioflow.alignment import (
     smith_waterman, needleman_wunsch, ScoringMatrix,
     Alignment, AlignmentType, AlignDirection,
     simple_align, alignment_score_only, percent_identity,
-    align_against_multiple, find_best_alignment
+    align_against_multiple, find_best_alignment, score_all_vs_all
 )
 
 
@@ -51,6 +56,21 @@ class TestScoringMatrix:
         scoring = ScoringMatrix.default_dna()
         assert scoring.score('A', 'T') == -1
 
+    def test_presets_are_shared_and_frozen(self):
+        """Test that preset matrices are cached, immutable instances."""
+        assert ScoringMatrix.default_dna() is ScoringMatrix.default_dna()
+        assert ScoringMatrix.blast_like() is ScoringMatrix.blast_like()
+        with pytest.raises(AttributeError):
+            ScoringMatrix.default_dna().match_score = 5
+
+    def test_table_matches_score(self):
+        """Test that the lookup table agrees with score()."""
+        scoring = ScoringMatrix.blast_like()
+        table = scoring.table()
+        for a in "ACGTUN":
+            for b in "ACGTUN":
+                assert table[ord(a)][ord(b)] == scoring.score(a, b)
+
 
 class TestSmithWaterman:
     """Tests for Smith-Waterman local alignment."""
@@ -179,6 +199,13 @@ class TestAlignment:
         cigar = alignment.to_cigar()
         assert "4M" in cigar  # 4 matches
 
+    def test_cigar_all_operations(self, monkeypatch):
+        """Test CIGAR runs with and without NumPy."""
+        alignment = Alignment.new("AT--CGTA-", "ATGGCCT-A", 0, AlignmentType.LOCAL)
+        assert alignment.to_cigar() == "2M2I1M1X1M1D1I"
+        monkeypatch.setattr("bioflow.alignment.np", None)
+        assert alignment.to_cigar() == "2M2I1M1X1M1D1I"
+
     def test_identity_calculation(self):
         """Test identity calculation."""
         alignment = Alignment.new("ATCG", "ATCG", 8, AlignmentType.LOCAL)
@@ -222,6 +249,15 @@ class TestAlignmentScoreOnly:
 
         assert score_only == full_alignment.score
 
+    def test_score_only_matches_full_with_gaps(self):
+        """Test score-only on unrelated sequences and a BLAST-like scheme."""
+        pairs = [("AGTACGCA", "TATGC"), ("GATTACA", "GCATGCT"), ("AAAA", "TTTT")]
+        for scoring in (None, ScoringMatrix.blast_like()):
+            for a, b in pairs:
+                seq1, seq2 = Sequence.new(a), Sequence.new(b)
+                assert alignment_score_only(seq1, seq2, scoring) == \
+                    smith_waterman(seq1, seq2, scoring).score
+
 
 class TestPercentIdentity:
     """Tests for percent_identity function."""
@@ -261,6 +297,30 @@ class TestMultipleAlignment:
         for idx, alignment in results:
             assert isinstance(alignment, Alignment)
 
+    def test_parallel_matches_serial(self):
+        """Test that a process pool returns the serial results in order."""
+        query = Sequence.new("ATCGATCGGA")
+        targets = [Sequence.new(s) for s in ("ATCG", "GCTAGGA", "AAAA", "TCGATC")]
+
+        parallel = align_against_multiple(query, targets, jobs=2)
+        serial = align_against_multiple(query, targets, jobs=1)
+
+        assert parallel == serial
+
+    def test_negative_jobs_raises_error(self):
+        """Test that a negative worker count raises an error."""
+        with pytest.raises(ValueError):
+            align_against_multiple(Sequence.new("ATCG"), [Sequence.new("ATCG")], jobs=-1)
+
+    def test_score_all_vs_all(self, monkeypatch):
+        """Test the pairwise score matrix on every available backend."""
+        sequences = [Sequence.new(s) for s in ("ATCGATCG", "GCTAGGA", "AAAA", "TCGATC")]
+        expected = [[alignment_score_only(a, b) for b in sequences] for a in sequences]
+
+        assert score_all_vs_all(sequences) == expected
+        monkeypatch.setattr("bioflow.alignment.parasail", None)
+        assert score_all_vs_all(sequences) == expected
+
     def test_find_best_alignment(self):
         """Test finding the best alignment."""
         query = Sequence.new("ATCG")
@@ -297,3 +357,102 @@ class TestEdgeCases:
 
         alignment = smith_waterman(seq1, seq2)
         assert alignment.score > 0
+
+
+class TestBackends:
+    """Tests that accelerated backends agree with the pure-Python path."""
+
+    PAIRS = [
+        ("AGTACGCA", "TATGC"),
+        ("ATCGATCG", "ATCATC"),
+        ("GATTACA", "GCATGCT"),
+        ("AAAA", "TTTT"),
+        ("ACGTNACGT", "ACGTACGT"),
+    ]
+
+    def test_parasail_score_only_matches_python(self, monkeypatch):
+        """Test parasail-backed alignment_score_only against the Python DP."""
+        pytest.importorskip("parasail")
+        rng = random.Random(7)
+        pairs = self.PAIRS + [
+            ("".join(rng.choice("ACGTN") for _ in range(rng.randint(1, 60))),
+             "".join(rng.choice("ACGTN") for _ in range(rng.randint(1, 60))))
+            for _ in range(50)
+        ]
+        fast = [alignment_score_only(Sequence.new(a), Sequence.new(b)) for a, b in pairs]
+        monkeypatch.setattr("bioflow.alignment.parasail", None)
+        monkeypatch.setattr("bioflow._numba_kernels.NUMBA_AVAILABLE", False)
+
+        for (a, b), score in zip(pairs, fast):
+            assert score == alignment_score_only(Sequence.new(a), Sequence.new(b))
+            assert score == smith_waterman(Sequence.new(a), Sequence.new(b)).score
+
+    def test_parasail_lane_width_does_not_change_results(self, monkeypatch):
+        """Test that going straight to 32-bit lanes gives the same scores."""
+        pytest.importorskip("parasail")
+        seqs = [Sequence.new(a) for a, _ in self.PAIRS]
+        narrow = [
+            alignment_score_only(Sequence.new(a), Sequence.new(b))
+            for a, b in self.PAIRS
+        ]
+        narrow_matrix = score_all_vs_all(seqs)
+        monkeypatch.setattr("bioflow.alignment._INT16_MAX", 0)
+
+        for (a, b), score in zip(self.PAIRS, narrow):
+            assert score == alignment_score_only(Sequence.new(a), Sequence.new(b))
+        assert score_all_vs_all(seqs) == narrow_matrix
+
+    def test_fits_16bit_bound(self):
+        """Test the local-score bound that picks the parasail lane width."""
+        from bioflow.alignment import _fits_16bit
+        scoring = ScoringMatrix.default_dna()  # match = 2
+        assert _fits_16bit(10000, 1, scoring)
+        assert _fits_16bit(16383, 20000, scoring)
+        assert not _fits_16bit(16384, 20000, scoring)
+
+    def test_cython_alignments_match_python(self, monkeypatch):
+        """Test that the compiled _align fill gives identical alignments."""
+        pytest.importorskip("bioflow._align")
+        monkeypatch.setattr("bioflow.alignment.parasail", None)
+        monkeypatch.setattr("bioflow._numba_kernels.NUMBA_AVAILABLE", False)
+        fast = [
+            (smith_waterman(Sequence.new(a), Sequence.new(b)),
+             needleman_wunsch(Sequence.new(a), Sequence.new(b)))
+            for a, b in self.PAIRS
+        ]
+        monkeypatch.setattr("bioflow.alignment._cython", None)
+
+        for (a, b), (sw, nw) in zip(self.PAIRS, fast):
+            assert sw == smith_waterman(Sequence.new(a), Sequence.new(b))
+            assert nw == needleman_wunsch(Sequence.new(a), Sequence.new(b))
+
+    def test_numba_alignments_match_python(self, monkeypatch):
+        """Test that the Numba DP fill gives identical alignments."""
+        pytest.importorskip("numba")
+        monkeypatch.setattr("bioflow.alignment.parasail", None)
+        monkeypatch.setattr("bioflow.alignment._NUMBA_MIN_CELLS", 0)
+        fast = [
+            (smith_waterman(Sequence.new(a), Sequence.new(b)),
+             needleman_wunsch(Sequence.new(a), Sequence.new(b)))
+            for a, b in self.PAIRS
+        ]
+        monkeypatch.setattr("bioflow._numba_kernels.NUMBA_AVAILABLE", False)
+
+        for (a, b), (sw, nw) in zip(self.PAIRS, fast):
+            assert sw == smith_waterman(Sequence.new(a), Sequence.new(b))
+            assert nw == needleman_wunsch(Sequence.new(a), Sequence.new(b))
+
+    def test_short_alignments_skip_numba(self):
+        """Test that alignments below the cell threshold never import Numba."""
+        code = (
+            "import sys\n"
+            "from bioflow import Sequence, smith_waterman, needleman_wunsch\n"
+            "smith_waterman(Sequence.new('ACGT'), Sequence.new('ACG'))\n"
+            "needleman_wunsch(Sequence.new('ACGT'), Sequence.new('ACG'))\n"
+            "print('numba' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+        assert result.stdout.strip() == "False"
@@ -3,11 +3,12 @@ Tests for the K-mer module.
 """
 
 import pytest
-from bioflow.sequence import Sequence
+from bioflow.sequence import Sequence, SequenceType
 from bioflow.kmer import (
     KMer, KMerCounter, count_kmers, most_frequent_kmers,
-    kmer_spectrum, kmer_distance, shared_kmers, find_unique_kmers,
-    count_kmers_canonical, kmer_positions
+    kmer_spectrum, kmer_distance, kmer_distance_from_counts, shared_kmers,
+    find_unique_kmers, count_kmers_canonical, kmer_positions,
+    count_kmers_fast, kmer_code, KMerBitset, count_kmers_batch
 )
 
 
@@ -88,6 +89,26 @@ class TestKMerCounter:
         assert counter.get_count("TGA") == 2
         assert counter.get_count("GAT") == 2
 
+    def test_packed_counting_matches_string_counting(self, monkeypatch):
+        """Test that 2-bit packed counting agrees with the string path."""
+        pytest.importorskip("numpy")
+        import bioflow.kmer as kmer_module
+
+        sequence = "ATGCNNATGCGTACGTTAGCNATGCAAATTTGGGCCC" * 3
+        for k in (1, 4, 7, 32):
+            packed = KMerCounter.new(k)
+            packed.count_kmers(sequence)
+            packed.count_kmers(sequence[:40])
+
+            monkeypatch.setattr(kmer_module, "np", None)
+            plain = KMerCounter.new(k)
+            plain.count_kmers(sequence)
+            plain.count_kmers(sequence[:40])
+            monkeypatch.undo()
+
+            assert list(packed.counts.items()) == list(plain.counts.items())
+            assert packed.total_kmers == plain.total_kmers
+
     def test_most_frequent(self):
         """Test getting most frequent k-mers."""
         counter = KMerCounter.new(3)
@@ -177,6 +198,54 @@ class TestKmerSpectrum:
         assert 2 in counts  # TGA and GAT appear twice
         assert 3 in counts  # ATG appears three times
 
+    def test_kmer_spectrum_matches_counter(self):
+        """Test the dense-array spectrum against the k-mer counter."""
+        seq = Sequence.new("ATGATGNNATGCCGTAATGCATG")
+        counter = count_kmers(seq, 3)
+        expected = {}
+        for count in counter.counts.values():
+            expected[count] = expected.get(count, 0) + 1
+        assert kmer_spectrum(seq, 3) == sorted(expected.items())
+
+
+class TestCountKmersFast:
+    """Tests for dense k-mer count arrays."""
+
+    def test_matches_counter(self):
+        """Test that the dense array agrees with KMerCounter."""
+        pytest.importorskip("numpy")
+        bases = "ATGATGNNATGCCGTAATGCATG"
+        counts = count_kmers_fast(bases, 3)
+        counter = count_kmers(Sequence.new(bases), 3)
+
+        assert len(counts) == 4 ** 3
+        assert counts.sum() == counter.total_kmers
+        for kmer, count in counter.counts.items():
+            assert counts[kmer_code(kmer)] == count
+
+    def test_rna_counts_u_as_t(self):
+        """Test that RNA U windows are counted under their T spelling."""
+        pytest.importorskip("numpy")
+        rna = Sequence(bases="ACGUNACGU", seq_type=SequenceType.RNA)
+        counts = count_kmers_fast(rna, 2)
+
+        assert counts.sum() == count_kmers(rna, 2).total_kmers
+        assert (counts == count_kmers_fast("ACGTNACGT", 2)).all()
+
+    def test_kmer_code(self):
+        """Test 2-bit k-mer codes."""
+        assert kmer_code("AAA") == 0
+        assert kmer_code("act") == 0b000111
+        assert kmer_code("TTTT") == 255
+        with pytest.raises(ValueError):
+            kmer_code("ANA")
+
+    def test_k_too_large_raises_error(self):
+        """Test that k beyond the dense limit raises an error."""
+        pytest.importorskip("numpy")
+        with pytest.raises(ValueError):
+            count_kmers_fast("ACGT" * 10, 13)
+
 
 class TestKmerDistance:
     """Tests for kmer_distance function."""
@@ -205,6 +274,17 @@ class TestKmerDistance:
         distance = kmer_distance(seq1, seq2, 3)
         assert 0.0 < distance < 1.0
 
+    def test_distance_from_counts(self):
+        """Test distance from precomputed counters matches kmer_distance."""
+        seq1 = Sequence.new("ATGATG")
+        seq2 = Sequence.new("ATGCCC")
+
+        distance = kmer_distance_from_counts(count_kmers(seq1, 3), count_kmers(seq2, 3))
+        assert distance == kmer_distance(seq1, seq2, 3)
+
+        with pytest.raises(ValueError):
+            kmer_distance_from_counts(count_kmers(seq1, 3), count_kmers(seq2, 2))
+
 
 class TestSharedKmers:
     """Tests for shared_kmers function."""
@@ -219,6 +299,75 @@ class TestSharedKmers:
         assert "GAT" in shared
 
 
+class TestCountKmersBatch:
+    """Tests for batch k-mer counting."""
+
+    def test_parallel_matches_serial(self):
+        """Test that a process pool returns the serial results in order."""
+        sequences = [
+            Sequence.new("ATGATGCGTA"),
+            Sequence.new("GGGNNACGT"),
+            Sequence(bases="ACGUUACGU", seq_type=SequenceType.RNA),
+            Sequence.new("TTTT"),
+        ]
+        parallel = count_kmers_batch(sequences, 3, jobs=2)
+        serial = count_kmers_batch(sequences, 3, jobs=1)
+
+        assert parallel == serial
+        assert serial == [count_kmers(seq, 3) for seq in sequences]
+
+    def test_negative_jobs_raises_error(self):
+        """Test that a negative worker count raises an error."""
+        with pytest.raises(ValueError):
+            count_kmers_batch([Sequence.new("ATCG")], 2, jobs=-1)
+
+
+class TestKMerBitset:
+    """Tests for k-mer presence bitsets."""
+
+    def test_matches_counter_sets(self):
+        """Test bitset set algebra against KMerCounter keys."""
+        pytest.importorskip("numpy")
+        seq1 = Sequence.new("ATGATGNNCGTACGATG")
+        seq2 = Sequence.new("GATGATTTACGTAC")
+        for k in (1, 3, 5):
+            bits1 = KMerBitset.from_sequence(seq1, k)
+            bits2 = KMerBitset.from_sequence(seq2, k)
+            keys1 = count_kmers(seq1, k).counts.keys()
+            keys2 = count_kmers(seq2, k).counts.keys()
+
+            assert len(bits1) == len(keys1)
+            assert bits1.intersection(bits2).kmers() == sorted(keys1 & keys2)
+            assert bits1.union_count(bits2) == len(keys1 | keys2)
+            assert bits1.jaccard_distance(bits2) == kmer_distance_from_counts(
+                count_kmers(seq1, k), count_kmers(seq2, k)
+            )
+
+    def test_equality(self):
+        """Test that bitsets compare by k and contents."""
+        pytest.importorskip("numpy")
+        seq = Sequence.new("ATGATGCGT")
+        assert KMerBitset.from_sequence(seq, 3) == KMerBitset.from_sequence(seq, 3)
+        assert KMerBitset.from_sequence(seq, 3) != KMerBitset.from_sequence(Sequence.new("ATGATG"), 3)
+        assert KMerBitset.from_sequence(seq, 1) != KMerBitset.from_sequence(seq, 2)
+
+    def test_rna_matches_dna_spelling(self):
+        """Test that an RNA bitset folds U onto T."""
+        pytest.importorskip("numpy")
+        rna = Sequence(bases="AUGAUGCGU", seq_type=SequenceType.RNA)
+        bits = KMerBitset.from_sequence(rna, 3)
+
+        assert bits == KMerBitset.from_sequence(Sequence.new("ATGATGCGT"), 3)
+        assert len(bits) == len(count_kmers(rna, 3).counts)
+
+    def test_mismatched_k_raises_error(self):
+        """Test that comparing different k raises an error."""
+        pytest.importorskip("numpy")
+        seq = Sequence.new("ATGATG")
+        with pytest.raises(ValueError):
+            KMerBitset.from_sequence(seq, 2).jaccard_distance(KMerBitset.from_sequence(seq, 3))
+
+
 class TestFindUniqueKmers:
     """Tests for find_unique_kmers function."""
 
@@ -244,6 +393,28 @@ class TestCanonicalKmers:
         # This tests that reverse complements are treated as same k-mer
         assert counts.k == 3
 
+    def test_packed_canonical_matches_string_path(self, monkeypatch):
+        """Test 2-bit canonical counting against KMer.canonical()."""
+        pytest.importorskip("numpy")
+        import bioflow.kmer as kmer_module
+
+        seq = Sequence.new("ATCGCGATNNACGTTGCAAGGCTTAGCNATCGAT" * 2)
+        for k in (1, 3, 6, 32):
+            packed = count_kmers_canonical(seq, k)
+            monkeypatch.setattr(kmer_module, "np", None)
+            plain = count_kmers_canonical(seq, k)
+            monkeypatch.undo()
+
+            assert list(packed.counts.items()) == list(plain.counts.items())
+            assert packed.total_kmers == plain.total_kmers
+
+    def test_revcomp2bit(self):
+        """Test the bit-level reverse complement of k-mer codes."""
+        from bioflow.kmer import _revcomp2bit
+
+        for kmer, rc in (("A", "T"), ("ACG", "CGT"), ("AACGTTTG", "CAAACGTT"), ("ACGT" * 8, "ACGT" * 8)):
+            assert _revcomp2bit(kmer_code(kmer), len(kmer)) == kmer_code(rc)
+
 
 class TestKmerPositions:
     """Tests for kmer_positions function."""
@@ -261,3 +432,15 @@ class TestKmerPositions:
         positions = kmer_positions(seq, "CCC")
 
         assert positions == []
+
+    def test_overlapping_positions(self, monkeypatch):
+        """Test overlapping matches on both the NumPy and str.find paths."""
+        import bioflow.kmer as kmer_module
+
+        seq = Sequence.new("AAAANAAAC")
+        expected = {"AA": [0, 1, 2, 5, 6], "NA": [4], "aac": [6], "X": []}
+        for kmer, positions in expected.items():
+            assert kmer_positions(seq, kmer) == positions
+        monkeypatch.setattr(kmer_module, "np", None)
+        for kmer, positions in expected.items():
+            assert kmer_positions(seq, kmer) == positions
@@ -2,6 +2,9 @@
 Tests for the Sequence module.
 """
 
+import pickle
+import sys
+
 import pytest
 from bioflow.sequence import (
     Sequence, SequenceType, SequenceError,
@@ -36,6 +39,20 @@ class TestSequenceCreation:
         assert exc_info.value.position == 4
         assert exc_info.value.found == 'X'
 
+    def test_invalid_base_reports_first_offender(self):
+        """Test the first invalid base is reported, including non-ASCII input."""
+        with pytest.raises(InvalidBaseError) as exc_info:
+            Sequence.new("acgtzzqacgt")
+        assert (exc_info.value.position, exc_info.value.found) == (4, 'Z')
+
+        with pytest.raises(InvalidBaseError) as exc_info:
+            Sequence.new("ACGTÉA")
+        assert (exc_info.value.position, exc_info.value.found) == (4, 'É')
+
+        with pytest.raises(InvalidBaseError) as exc_info:
+            Sequence(bases="ACGUT", seq_type=SequenceType.RNA)
+        assert (exc_info.value.position, exc_info.value.found) == (4, 'T')
+
     def test_sequence_with_id(self):
         """Test creating sequence with ID."""
         seq = Sequence.with_id("ATCG", "seq1")
@@ -54,6 +71,64 @@ class TestSequenceCreation:
         assert seq.description == "Test sequence"
         assert seq.seq_type == SequenceType.DNA
 
+    def test_from_many(self):
+        """Test batch creation of sequences."""
+        seqs = Sequence.from_many(["ATCG", "ggcc", "NNAT"])
+        assert [s.bases for s in seqs] == ["ATCG", "GGCC", "NNAT"]
+        assert all(s.seq_type == SequenceType.DNA for s in seqs)
+
+    def test_from_many_reports_invalid_base(self):
+        """Test that batch creation still reports the invalid position."""
+        with pytest.raises(InvalidBaseError) as exc_info:
+            Sequence.from_many(["ATCG", "ATUG"])
+        assert exc_info.value.position == 2
+        assert exc_info.value.found == 'U'
+
+        rna = Sequence.from_many(["AUCG"], SequenceType.RNA)
+        assert rna[0].seq_type == SequenceType.RNA
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_sequence_uses_slots(self):
+        """Test that sequences carry no per-instance __dict__."""
+        seq = Sequence.new("ATCG")
+        assert not hasattr(seq, "__dict__")
+
+    def test_reassigning_bases_clears_caches(self):
+        """Test that cached length, hash, counts and encodings follow new bases."""
+        seq = Sequence.new("ACGT")
+        seq.base_counts()
+        hash(seq)
+        seq.raw
+        seq.bases = "GGGGGGGG"
+        assert len(seq) == 8
+        assert seq.gc_content() == 1.0
+        assert seq.base_counts() == (0, 0, 8, 0, 0)
+        assert seq.raw == b"GGGGGGGG"
+        assert seq == Sequence.new("GGGGGGGG")
+        assert hash(seq) == hash(Sequence.new("GGGGGGGG"))
+
+    def test_reassigning_seq_type_clears_hash(self):
+        """Test that the cached hash follows a new seq_type."""
+        seq = Sequence.new("ACGA")
+        hash(seq)
+        seq.seq_type = SequenceType.RNA
+        rna = Sequence(bases="ACGA", seq_type=SequenceType.RNA)
+        assert seq == rna
+        assert hash(seq) == hash(rna)
+
+    def test_pickle_drops_caches(self):
+        """Test that pickling keeps the fields but none of the caches."""
+        seq = Sequence.with_metadata("ACGTN", "s1", "demo", SequenceType.DNA)
+        hash(seq)
+        seq.raw
+        seq.base_counts()
+        restored = pickle.loads(pickle.dumps(seq))
+        assert (restored._hash, restored._raw, restored._counts) == (None, None, None)
+        assert restored == seq
+        assert (restored.id, restored.description) == ("s1", "demo")
+        assert restored.base_counts() == seq.base_counts()
+        assert restored in {seq}
+
 
 class TestSequenceOperations:
     """Tests for sequence operations."""
@@ -87,31 +162,92 @@ class TestSequenceOperations:
         assert t == 3
         assert n == 1
 
+    def test_counts_shared_by_content(self, monkeypatch):
+        """Test gc/at content reuse one cached count, across count paths."""
+        seq = Sequence.new("AACCCGGGTTTN" * 500)
+        assert seq.base_counts() == (1000, 1500, 1500, 1500, 500)
+        assert seq.base_counts() is seq.base_counts()
+        assert seq.gc_content() == 3000 / 6000
+        assert seq.at_content() == 2500 / 6000
+
+        monkeypatch.setattr("bioflow.sequence._BINCOUNT_MIN_LENGTH", 1 << 30)
+        fresh = Sequence.new(seq.bases)
+        assert fresh.base_counts() == seq.base_counts()
+
     def test_complement(self):
         """Test DNA complement."""
         seq = Sequence.new("ATCG")
         comp = seq.complement()
         assert comp.bases == "TAGC"
 
+        seq = Sequence.new("ACGTNNACGT")
+        expected = ''.join(Sequence.complement_base(b) for b in seq.bases)
+        assert seq.complement().bases == expected
+
     def test_reverse(self):
         """Test sequence reversal."""
         seq = Sequence.new("ATCG")
         rev = seq.reverse()
         assert rev.bases == "GCTA"
 
+        seq.base_counts()
+        assert seq.reverse().base_counts() == seq.base_counts()
+        assert Sequence.new("ACCGGGTN").reverse().base_counts() == (1, 2, 3, 1, 1)
+
     def test_reverse_complement(self):
         """Test reverse complement."""
         seq = Sequence.new("ATCG")
         rc = seq.reverse_complement()
         assert rc.bases == "CGAT"
 
+        seq = Sequence.new("AACGNTTGCAN")
+        assert seq.reverse_complement().bases == seq.complement().bases[::-1]
+        assert seq.reverse_complement().reverse_complement() == seq
+
     def test_transcribe(self):
         """Test DNA to RNA transcription."""
         seq = Sequence.new("ATCG")
         rna = seq.transcribe()
         assert rna.bases == "AUCG"
+        assert Sequence.new("TTNACT").transcribe().bases == "UUNACU"
         assert rna.seq_type == SequenceType.RNA
 
+    def test_transcribe_long(self):
+        """Test transcription past the str.replace length cutoff."""
+        bases = "ATCGN" * 5000
+        assert Sequence.new(bases).transcribe().bases == bases.replace("T", "U")
+
+    def test_derived_sequences_match_constructed(self):
+        """Test derived sequences equal freshly validated ones, metadata included."""
+        seq = Sequence.with_metadata("ACGTNACGGT", "s1", "demo", SequenceType.DNA)
+        derived = [
+            seq.complement(), seq.reverse(), seq.reverse_complement(),
+            seq.subsequence(2, 7), seq.concat(seq), seq.transcribe(),
+        ]
+        for d in derived:
+            fresh = Sequence(bases=d.bases, seq_type=d.seq_type)
+            assert d == fresh
+            assert hash(d) == hash(fresh)
+            assert len(d) == len(fresh)
+            assert d.base_counts() == fresh.base_counts()
+            assert (d.id, d.description) == ("s1", "demo")
+            assert repr(d) == repr(Sequence.with_metadata(d.bases, "s1", "demo", d.seq_type))
+
+    def test_derived_sequences_inherit_counts(self, monkeypatch):
+        """Test derived sequences reuse the source's cached base counts."""
+        seq = Sequence.new("AACCCGGGGTN")
+        seq.base_counts()
+        derived = [
+            seq.complement(), seq.reverse(), seq.reverse_complement(),
+            seq.transcribe(), seq.concat(seq),
+        ]
+        for d in derived:
+            assert d._counts is not None
+            assert d.base_counts() == Sequence(bases=d.bases, seq_type=d.seq_type).base_counts()
+
+        monkeypatch.setattr("bioflow.sequence._NUMBA_REVCOMP_MIN_LENGTH", 0)
+        assert seq.reverse_complement().base_counts() == (1, 4, 3, 2, 1)
+
     def test_concat(self):
         """Test sequence concatenation."""
         seq1 = Sequence.new("ATCG")
@@ -120,6 +256,24 @@ class TestSequenceOperations:
         assert concat.bases == "ATCGGCTA"
         assert len(concat) == 8
 
+    def test_concat_all(self):
+        """Test concatenating many sequences at once."""
+        parts = [Sequence.with_id("ATCG", "first"), Sequence.new("GG"), Sequence.new("NA")]
+        for part in parts[:2]:
+            part.base_counts()
+        joined = Sequence.concat_all(parts)
+        assert joined.bases == "ATCGGGNA"
+        assert joined.id == "first"
+        assert joined.base_counts() == (2, 1, 3, 1, 1)
+
+        parts[2].base_counts()
+        assert Sequence.concat_all(parts).base_counts() == (2, 1, 3, 1, 1)
+
+        with pytest.raises(ValueError):
+            Sequence.concat_all([])
+        with pytest.raises(ValueError):
+            Sequence.concat_all([parts[0], parts[0].transcribe()])
+
 
 class TestMotifOperations:
     """Tests for motif finding."""
@@ -142,6 +296,36 @@ class TestMotifOperations:
         positions = seq.find_motif_positions("GGGG")
         assert positions == []
 
+    def test_find_motif_positions_overlapping(self):
+        """Test motif search reports overlapping matches."""
+        seq = Sequence.new("ATCGATCGATCGAAAA")
+        assert seq.find_motif_positions("aaa") == [12, 13]
+        assert seq.find_motif_positions("AAAAA") == []
+        assert seq.find_motif_positions("ATCGATCGATCGAAAA") == [0]
+
+    def test_vectorized_motif_scan_matches_walk(self, monkeypatch):
+        """Test the NumPy short-motif scan against the str.find walk."""
+        pytest.importorskip("numpy")
+        seq = Sequence.new("ATCGATCGATCGAAAANNGA")
+        motifs = ["A", "GA", "AAA", "GATC", "NNG", "TTTT", "ATCGATCGATCGAAAANNGAT"]
+        expected = [seq.find_motif_positions(m) for m in motifs]
+
+        monkeypatch.setattr("bioflow.sequence._VECTOR_MOTIF_MIN_LENGTH", 0)
+        monkeypatch.setattr("bioflow.sequence._VECTOR_MOTIF_MAX_LEN", 100)
+        monkeypatch.setattr("bioflow.sequence._VECTOR_MOTIF_MAX_LEN_SZ", 100)
+        assert [seq.find_motif_positions(m) for m in motifs] == expected
+        assert seq.find_motif_positions("é") == []
+
+    def test_stringzilla_scan_matches_walk(self, monkeypatch):
+        """Test the StringZilla find walk against the str.find walk."""
+        pytest.importorskip("stringzilla")
+        seq = Sequence.new("ATCGATCGATCGAAAANNGA")
+        motifs = ["A", "GA", "AAA", "GATC", "NNG", "TTTT", "ATCGATCGATCGAAAANNGAT", "é"]
+        found = [seq.find_motif_positions(m) for m in motifs]
+
+        monkeypatch.setattr("bioflow.sequence.sz", None)
+        assert [seq.find_motif_positions(m) for m in motifs] == found
+
 
 class TestSubsequence:
     """Tests for subsequence extraction."""
@@ -152,6 +336,16 @@ class TestSubsequence:
         subseq = seq.subsequence(2, 6)
         assert subseq.bases == "CGAT"
 
+    def test_subsequence_shares_codes(self):
+        """Test a subsequence views the parent's cached codes without copying."""
+        np = pytest.importorskip("numpy")
+        seq = Sequence.new("ATCGATCGNN")
+        seq.codes
+        subseq = seq.subsequence(2, 9)
+        assert np.shares_memory(subseq.codes, seq.codes)
+        assert subseq.codes.tolist() == Sequence.new(subseq.bases).codes.tolist()
+        assert not subseq.codes.flags.writeable
+
     def test_subsequence_invalid_start(self):
         """Test subsequence with invalid start."""
         seq = Sequence.new("ATCG")
@@ -175,6 +369,13 @@ class TestSequenceOutput:
         assert ">seq1" in fasta
         assert "ATCG" in fasta
 
+    def test_to_fasta_wraps_lines(self):
+        """Test FASTA output wraps at 80 bases with one trailing newline."""
+        seq = Sequence.with_metadata("ACGT" * 41, "seq1", "demo", SequenceType.DNA)
+        bases = seq.bases
+        assert seq.to_fasta() == f">seq1 demo\n{bases[:80]}\n{bases[80:160]}\n{bases[160:]}\n"
+        assert Sequence.new("ACGT" * 20).to_fasta() == ">sequence\n" + "ACGT" * 20 + "\n"
+
     def test_str_with_id(self):
         """Test string representation with ID."""
         seq = Sequence.with_id("ATCG", "seq1")
@@ -199,6 +400,14 @@ class TestAmbiguousBases:
         seq = Sequence.new("ATNNCG")
         assert seq.count_ambiguous() == 2
 
+        # Same answers once base_counts has been cached
+        seq.base_counts()
+        assert seq.count_ambiguous() == 2
+        assert seq.has_ambiguous()
+        clean = Sequence.new("ATCG")
+        clean.base_counts()
+        assert not clean.has_ambiguous()
+
 
 class TestEquality:
     """Tests for sequence equality."""
@@ -215,8 +424,169 @@ class TestEquality:
         seq2 = Sequence.new("GCTA")
         assert seq1 != seq2
 
+    def test_equality_edge_cases(self):
+        """Test identity, type and non-Sequence comparisons."""
+        seq = Sequence.new("ACGA")
+        assert seq == seq
+        assert seq != "ACGA"
+        assert not (seq == None)  # noqa: E711
+        assert Sequence(bases="ACGA", seq_type=SequenceType.RNA) != seq
+        assert Sequence(bases="ACGA", seq_type=SequenceType.UNKNOWN) != seq
+
     def test_hash_equal_sequences(self):
         """Test that equal sequences have equal hashes."""
         seq1 = Sequence.new("ATCG")
         seq2 = Sequence.new("ATCG")
         assert hash(seq1) == hash(seq2)
+
+    def test_hashed_sequences_compare_by_content(self):
+        """Test equality after hashes have been cached."""
+        seq1 = Sequence.new("ATCG")
+        seq2 = Sequence.new("ATCG")
+        seq3 = Sequence.new("ATCC")
+        assert len({seq1, seq2, seq3}) == 2
+        assert seq1 == seq2
+        assert seq1 != seq3
+
+    def test_equality_ignores_cached_hash(self):
+        """Test that equality compares content, not whatever hash is cached."""
+        seq1 = Sequence.new("ATCG")
+        seq2 = Sequence.new("ATCG")
+        hash(seq1)
+        seq2._hash = hash(seq1) + 1  # e.g. computed under another hash seed
+        assert seq1 == seq2
+
+    def test_raw(self):
+        """Test the cached ASCII byte form of the bases."""
+        seq = Sequence.new("acgtn")
+        assert seq._raw is None  # Encoded lazily, not kept from validation
+        assert seq.raw == b"ACGTN"
+        assert seq.raw is seq.raw
+        assert seq.reverse_complement().raw == b"NACGT"
+
+    def test_codes(self):
+        """Test the cached base-code array."""
+        pytest.importorskip("numpy")
+        seq = Sequence.new("ACGTN")
+        assert seq.codes.tolist() == [0, 1, 2, 3, 4]
+        assert seq.codes is seq.codes
+        rna = Sequence(bases="ACGUN", seq_type=SequenceType.RNA)
+        assert rna.codes.tolist() == [0, 1, 2, 3, 4]
+
+
+class TestNumbaKernels:
+    """Tests for the optional Numba paths (forced on for short inputs)."""
+
+    @pytest.fixture(autouse=True)
+    def force_kernels(self, monkeypatch):
+        pytest.importorskip("numba")
+        monkeypatch.setattr("bioflow.sequence._NUMBA_COUNT_MIN_LENGTH", 0)
+
+    def test_base_counts(self):
+        """Test kernel base counting matches the expected tuple."""
+        seq = Sequence.new("AACCCGGGTTTN")
+        assert seq.base_counts() == (2, 3, 3, 3, 1)
+
+    def test_reverse_complement(self, monkeypatch):
+        """Test the one-pass kernel against translate + slice."""
+        seq = Sequence.new("AACGNTTGCANGGA")
+        expected = seq.bases.translate(str.maketrans("ACGTN", "TGCAN"))[::-1]
+        monkeypatch.setattr("bioflow.sequence._NUMBA_REVCOMP_MIN_LENGTH", 0)
+        rc = seq.reverse_complement()
+        assert rc.bases == expected
+        assert rc.raw == expected.encode("ascii")
+
+    def test_base_counts_word_tail(self):
+        """Test word-wise counting handles lengths that are not multiples of 8."""
+        for bases in ["ACG", "ACGTNACG", "ACGTNACGT", "GATTACAN" * 5 + "CCT"]:
+            expected = tuple(bases.count(b) for b in "ACGTN")
+            assert Sequence.new(bases).base_counts() == expected
+
+        rna = Sequence(bases="ACGUUNACGU", seq_type=SequenceType.RNA)
+        assert rna.base_counts() == (2, 2, 2, 3, 1)
+
+
+class TestSeqcore:
+    """Tests for the optional compiled sequence primitives."""
+
+    @pytest.fixture(autouse=True)
+    def require_seqcore(self):
+        pytest.importorskip("bioflow._seqcore")
+
+    def test_base_counts_match_str_count(self, monkeypatch):
+        """Test compiled counting against str.count."""
+        monkeypatch.setattr("bioflow._numba_kernels.NUMBA_AVAILABLE", False)
+        seq = Sequence.new("AACCCGGGGTNNA" * 7)
+        assert seq.base_counts() == tuple(seq.bases.count(b) for b in "ACGTN")
+        rna = Sequence(bases="ACGUUNACGU", seq_type=SequenceType.RNA)
+        assert rna.base_counts() == (2, 2, 2, 3, 1)
+
+    def test_reverse_complement_matches_translate(self, monkeypatch):
+        """Test the compiled reverse complement against translate + slice."""
+        seq = Sequence.new("AACGNTTGCANGGA")
+        rc = seq.reverse_complement()
+        monkeypatch.setattr("bioflow.sequence._seqcore", None)
+        monkeypatch.setattr("bioflow._numba_kernels.NUMBA_AVAILABLE", False)
+        assert rc == seq.reverse_complement()
+        assert rc.raw == rc.bases.encode("ascii")
+
+
+class TestSequenceBatch:
+    """Tests for the structure-of-arrays sequence batch."""
+
+    def test_from_sequences(self):
+        """Test packing sequences into one buffer with offsets."""
+        pytest.importorskip("numpy")
+        from bioflow.sequence import SequenceBatch
+
+        batch = SequenceBatch.from_sequences([
+            Sequence.with_id("ATGC", "a"),
+            Sequence.with_id("GGGNN", "b"),
+        ])
+
+        assert len(batch) == 2
+        assert batch.buf.tobytes() == b"ATGCGGGNN"
+        assert batch.offsets.tolist() == [0, 4, 9]
+        assert batch.lengths().tolist() == [4, 5]
+        assert batch.gc_contents().tolist() == [0.5, 0.6]
+        assert batch.byte_counts()[ord("N")] == 2
+        assert batch.ids == ["a", "b"]
+
+    def test_equality(self):
+        """Test that batches compare by buffer, offsets, ids and types."""
+        pytest.importorskip("numpy")
+        from bioflow.sequence import SequenceBatch
+
+        seqs = [Sequence.with_id("ATGC", "a"), Sequence.with_id("GGGNN", "b")]
+        assert SequenceBatch.from_sequences(seqs) == SequenceBatch.from_sequences(seqs)
+        assert SequenceBatch.from_sequences(seqs) != SequenceBatch.from_sequences(seqs[::-1])
+        assert SequenceBatch.from_sequences(seqs) != SequenceBatch.from_sequences(
+            [Sequence.new("ATGC"), Sequence.new("GGGNN")]
+        )
+
+    def test_from_sequences_leaves_inputs_untouched(self):
+        """Test that packing does not cache a bytes copy on each input."""
+        pytest.importorskip("numpy")
+        from bioflow.sequence import SequenceBatch
+
+        cached = Sequence.new("ATGC")
+        cached.raw
+        fresh = Sequence.new("GGGNN")
+        batch = SequenceBatch.from_sequences([cached, fresh])
+
+        assert batch.buf.tobytes() == b"ATGCGGGNN"
+        assert fresh._raw is None
+
+    def test_find_motif_positions(self):
+        """Test batch motif search matches per-sequence search."""
+        pytest.importorskip("numpy")
+        from bioflow.sequence import SequenceBatch
+
+        sequences = [Sequence.new(b) for b in ["GATCGA", "TCGATC", "AAAA", "GA", "TCGGATC"]]
+        batch = SequenceBatch.from_sequences(sequences)
+        for motif in ["GATC", "ga", "AAA", "TCGA", "C"]:
+            expected = [seq.find_motif_positions(motif) for seq in sequences]
+            assert batch.find_motif_positions(motif) == expected
+        # "GA|TC" straddles the first boundary and must not be reported
+        assert batch.find_motif_positions("GATCGATC") == [[], [], [], [], []]
+        assert batch.find_motif_positions("é") == [[], [], [], [], []]
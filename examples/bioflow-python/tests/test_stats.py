@@ -0,0 +1,107 @@
+"""
+Tests for the Stats module.
+"""
+
+import pytest
+from bioflow.sequence import Sequence
+from bioflow.stats import (
+    SequenceStats, SequenceSetStats, GCHistogram, LengthHistogram
+)
+
+
+class TestSequenceStats:
+    """Tests for single-sequence statistics."""
+
+    def test_from_sequence(self):
+        """Test statistics for a single sequence."""
+        stats = SequenceStats.from_sequence(Sequence.new("AACCCGGGTTTN"))
+        assert stats.length == 12
+        assert stats.gc_content == 0.5
+        assert (stats.a_count, stats.c_count, stats.g_count) == (2, 3, 3)
+        assert (stats.t_count, stats.n_count) == (3, 1)
+        assert stats.has_ambiguous
+
+
+class TestSequenceSetStats:
+    """Tests for sequence collection statistics."""
+
+    def test_from_sequences(self):
+        """Test aggregate statistics over several sequences."""
+        sequences = [
+            Sequence.new("A" * 10),
+            Sequence.new("GC" * 10),
+            Sequence.new("ATGN" * 10),
+        ]
+        stats = SequenceSetStats.from_sequences(sequences)
+
+        assert stats.count == 3
+        assert stats.total_bases == 70
+        assert stats.min_length == 10
+        assert stats.max_length == 40
+        assert stats.median_length == 20
+        assert stats.n50 == 40
+        assert stats.total_ambiguous == 10
+        assert stats.mean_gc_content == pytest.approx((0.0 + 1.0 + 0.25) / 3)
+
+    def test_median_even_count(self):
+        """Test median of an even number of lengths."""
+        sequences = [Sequence.new("A" * n) for n in (2, 4, 6, 8)]
+        stats = SequenceSetStats.from_sequences(sequences)
+        assert stats.median_length == 5
+
+    def test_n50(self):
+        """Test N50 calculation."""
+        sequences = [Sequence.new("A" * n) for n in (2, 3, 4, 5, 6, 7, 8, 9, 10)]
+        stats = SequenceSetStats.from_sequences(sequences)
+        # 54 bases total; 10 + 9 + 8 = 27 reaches half
+        assert stats.n50 == 8
+
+    def test_empty_list_raises_error(self):
+        """Test that an empty list raises an error."""
+        with pytest.raises(ValueError):
+            SequenceSetStats.from_sequences([])
+
+
+class TestGCHistogram:
+    """Tests for GC content histograms."""
+
+    def test_from_sequences(self):
+        """Test binning of GC content values."""
+        sequences = [
+            Sequence.new("AAAA"),   # 0%
+            Sequence.new("ATGC"),   # 50%
+            Sequence.new("AGCC"),   # 75%
+            Sequence.new("GCGC"),   # 100% lands in the last bin
+        ]
+        hist = GCHistogram.from_sequences(sequences, num_bins=4)
+
+        assert hist.bins == [1, 0, 1, 2]
+        assert sum(hist.bins) == len(sequences)
+        assert all(isinstance(b, int) for b in hist.bins)
+
+    def test_mode_bin(self):
+        """Test the most common GC range."""
+        sequences = [Sequence.new("GCGC"), Sequence.new("GGCC"), Sequence.new("AAAA")]
+        hist = GCHistogram.from_sequences(sequences, num_bins=10)
+        start, end = hist.mode_bin()
+        assert start == pytest.approx(0.9)
+        assert end == pytest.approx(1.0)
+
+
+class TestLengthHistogram:
+    """Tests for length histograms."""
+
+    def test_from_sequences(self):
+        """Test binning of sequence lengths."""
+        sequences = [Sequence.new("A" * n) for n in (1, 2, 5, 9, 10)]
+        hist = LengthHistogram.from_sequences(sequences, num_bins=3)
+
+        assert hist.min_length == 1
+        assert hist.max_length == 10
+        assert hist.bin_width == 4
+        assert hist.bins == [2, 1, 2]
+
+    def test_invalid_bins_raises_error(self):
+        """Test that non-positive bin counts raise an error."""
+        with pytest.raises(ValueError):
+            LengthHistogram.from_sequences([Sequence.new("ATCG")], num_bins=0)